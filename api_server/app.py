@@ -1,28 +1,75 @@
 # api_server/app.py
 
 import os
-from flask import Flask, jsonify
+import json
+from flask import Flask, Response
 from mongoengine import connect
+from flask_compress import Compress
 from dotenv import load_dotenv
 
+from config import Config
+from utils.json_provider import ORJSONProvider
+
 load_dotenv()
 
 
+# -------------------------
+# BASIC ROUTE HANDLERS
+# -------------------------
+# Both bodies are constant, so they are serialized once at import time
+_HOME_BODY = json.dumps({
+    "message": "StockaDoodle API LIVE!",
+    "status": "Production Ready",
+    "database": "MongoDB"
+}).encode('utf-8')
+
+_HEALTH_BODY = json.dumps({"status": "healthy"}).encode('utf-8')
+
+
+def _home():
+    return Response(_HOME_BODY, mimetype='application/json')
+
+
+def _health():
+    resp = Response(_HEALTH_BODY, status=200, mimetype='application/json')
+    resp.headers['Cache-Control'] = 'no-cache'
+    return resp
+
+
 def create_app():
     app = Flask(__name__)
 
+    # orjson behind jsonify() and request.get_json()
+    app.json = ORJSONProvider(app)
+
     # -------------------------
     # CONFIG
     # -------------------------
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'stockadoodle-dev-2025')
 
+    # Reject oversized bodies (image uploads) before Werkzeug buffers them
+    app.config['MAX_CONTENT_LENGTH'] = int(os.getenv('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))
+
+    # Compress JSON responses (product/category lists, inline images)
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+
     # Use ONE consistent env key for Mongo
     mongo_uri = os.getenv('MONGO_URI') or os.getenv('MONGODB_URI') or 'mongodb://localhost:27017/'
     db_name = os.getenv('DATABASE_NAME', 'stockadoodle')
 
     connect(
         db=db_name,
-        host=mongo_uri
+        host=mongo_uri,
+        # pool sizing for concurrent report reads + inventory writes
+        maxPoolSize=Config.MONGO_MAX_POOL_SIZE,
+        minPoolSize=Config.MONGO_MIN_POOL_SIZE,
+        maxIdleTimeMS=Config.MONGO_MAX_IDLE_TIME_MS,
+        serverSelectionTimeoutMS=Config.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        retryWrites=True
     )
 
     # Ensure models are loaded
@@ -38,6 +85,8 @@ def create_app():
             user
         )
 
+    Compress(app)
+
     # -------------------------
     # BLUEPRINT REGISTRATION
     # -------------------------
@@ -81,17 +130,8 @@ def create_app():
     # -------------------------
     # BASIC ROUTES
     # -------------------------
-    @app.route('/api/v1')
-    def home():
-        return jsonify({
-            "message": "StockaDoodle API LIVE!",
-            "status": "Production Ready",
-            "database": "MongoDB"
-        })
-
-    @app.route('/api/v1/health')
-    def health():
-        return jsonify({"status": "healthy"}), 200
+    app.add_url_rule('/api/v1', 'home', _home)
+    app.add_url_rule('/api/v1/health', 'health', _health)
 
     return app
 
@@ -19,6 +19,12 @@ class Config:
     MONGO_URI = os.getenv('MONGO_URI') or os.getenv('MONGODB_URI') or 'mongodb://localhost:27017/'
     DATABASE_NAME = os.getenv('DATABASE_NAME', 'stockadoodle')
 
+    # Connection pool tuning, so long report reads don't starve writes
+    MONGO_MAX_POOL_SIZE = int(os.getenv('MONGO_MAX_POOL_SIZE', 100))
+    MONGO_MIN_POOL_SIZE = int(os.getenv('MONGO_MIN_POOL_SIZE', 5))
+    MONGO_MAX_IDLE_TIME_MS = int(os.getenv('MONGO_MAX_IDLE_TIME_MS', 60000))
+    MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv('MONGO_SERVER_SELECTION_TIMEOUT_MS', 5000))
+
     # EMAIL/SMTP configuration (for mfa and notification)
     # Your original used SMTP=... which is unusual; keep both just in case
     SMTP_HOST = os.getenv('SMTP_HOST') or os.getenv('SMTP') or 'smtp.gmail.com'
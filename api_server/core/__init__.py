@@ -0,0 +1,9 @@
+# api_server/core/__init__.py
+
+
+def __getattr__(name):
+    # Lazy export so importing core does not pull in ReportLab
+    if name == 'PDFReportGenerator':
+        from .pdf_report_generator import PDFReportGenerator
+        return PDFReportGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,150 @@
 
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
+import threading
+import time
 from datetime import datetime, timezone
 from typing import Optional, Union
 
 from models.product_log import ProductLog
 from models.api_activity_log import APIActivityLog
 from models.user import User
+from utils.counters import reserve_sequence_block
+
+
+# ---------------------------------------------------------
+# Background writer for API activity logs.
+# Requests only enqueue; a daemon thread inserts in batches.
+# ---------------------------------------------------------
+_QUEUE_MAXSIZE = 8192
+_BATCH_SIZE = 200
+_FLUSH_INTERVAL = 0.05  # seconds to wait for more entries before writing
+_SHUTDOWN_TIMEOUT = 5.0  # seconds the exit hook waits for the writer to finish
+
+# queued by the exit hook; the writer writes its current batch and stops
+_STOP = object()
+
+logger = logging.getLogger(__name__)
+
+_api_log_queue: "queue.Queue[dict]" = queue.Queue(maxsize=_QUEUE_MAXSIZE)
+_writer_thread: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _enqueue_api_log(entry: dict):
+    """Queue an entry, dropping the oldest one if the queue is full."""
+    _ensure_writer()
+    while True:
+        try:
+            _api_log_queue.put_nowait(entry)
+            return
+        except queue.Full:
+            try:
+                _api_log_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _ensure_writer():
+    global _writer_thread
+    if _writer_thread is not None and _writer_thread.is_alive():
+        return
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="api-activity-log-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def _writer_loop():
+    while True:
+        item = _api_log_queue.get()
+        if item is _STOP:
+            return
+        batch = [item]
+        deadline = time.monotonic() + _FLUSH_INTERVAL
+        while len(batch) < _BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = _api_log_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                _write_api_logs(batch)
+                return
+            batch.append(item)
+        _write_api_logs(batch)
+
+
+def _write_api_logs(batch: list[dict]):
+    """Insert a batch of queued entries with one user lookup and one insert."""
+    if not batch:
+        return
+    try:
+        user_ids = {e['user'] for e in batch if isinstance(e['user'], int)}
+        users = {u.id: u for u in User.objects(id__in=list(user_ids))} if user_ids else {}
+
+        first_id = reserve_sequence_block(APIActivityLog.__name__.lower(), len(batch))
+        docs = []
+        for offset, entry in enumerate(batch):
+            user_ref = entry['user']
+            docs.append(APIActivityLog(
+                id=first_id + offset,
+                method=entry['method'],
+                target_entity=entry['target_entity'],
+                user=users.get(user_ref) if isinstance(user_ref, int) else user_ref,
+                source=entry['source'],
+                details=entry['details'],
+                timestamp=entry['timestamp']
+            ))
+        APIActivityLog.objects.insert(docs, load_bulk=False)
+    except Exception:
+        # audit logging must never take the writer thread down
+        logger.exception("Failed to write %d API activity logs", len(batch))
+
+
+def flush_api_logs():
+    """
+    Write out everything still queued (called at interpreter exit).
+
+    A running writer is told to stop behind the queued entries and joined,
+    so the batch it is holding is written too; whatever is left after it
+    exits (or if it never started) is written here.
+    """
+    writer = _writer_thread
+    if writer is not None and writer.is_alive():
+        try:
+            _api_log_queue.put(_STOP, timeout=_SHUTDOWN_TIMEOUT)
+        except queue.Full:
+            pass
+        writer.join(_SHUTDOWN_TIMEOUT)
+        if writer.is_alive():
+            # still writing: draining here would race it for the tail
+            logger.warning("API activity log writer did not finish within %.0fs", _SHUTDOWN_TIMEOUT)
+            return
+
+    batch = []
+    while True:
+        try:
+            item = _api_log_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is _STOP:
+            continue
+        batch.append(item)
+        if len(batch) >= _BATCH_SIZE:
+            _write_api_logs(batch)
+            batch = []
+    _write_api_logs(batch)
+
+
+atexit.register(flush_api_logs)
 
 
 class ActivityLogger:
@@ -53,24 +191,59 @@ class ActivityLogger:
         """
         user_obj = ActivityLogger._resolve_user(user_id)
 
-        final_notes = notes
-        if quantity is not None:
-            if final_notes:
-                final_notes = f"Quantity: {quantity}. {final_notes}"
-            else:
-                final_notes = f"Quantity: {quantity}."
-
         log = ProductLog(
             product_id=product_id,
             user=user_obj,
             action_type=action_type,
             quantity=quantity,
-            notes=final_notes,
+            notes=ActivityLogger._quantity_notes(quantity, notes),
             log_time=datetime.now(timezone.utc)
         )
         log.save()
         return log
 
+    @staticmethod
+    def log_product_actions(
+        entries: list[dict],
+        user_id: Optional[Union[int, User]]
+    ):
+        """
+        Log several product actions by the same user with one insert.
+
+        Each entry holds the product_id, action_type, quantity and notes
+        arguments of log_product_action.
+        """
+        if not entries:
+            return []
+
+        user_obj = ActivityLogger._resolve_user(user_id)
+        now = datetime.now(timezone.utc)
+        first_id = reserve_sequence_block(ProductLog.__name__.lower(), len(entries))
+
+        logs = [
+            ProductLog(
+                id=first_id + offset,
+                product_id=entry['product_id'],
+                user=user_obj,
+                action_type=entry['action_type'],
+                quantity=entry.get('quantity'),
+                notes=ActivityLogger._quantity_notes(entry.get('quantity'), entry.get('notes')),
+                log_time=now
+            )
+            for offset, entry in enumerate(entries)
+        ]
+        ProductLog.objects.insert(logs, load_bulk=False)
+        return logs
+
+    @staticmethod
+    def _quantity_notes(quantity: Optional[int], notes: Optional[str]) -> Optional[str]:
+        """Prefix notes with the quantity, as shown in the product history."""
+        if quantity is None:
+            return notes
+        if notes:
+            return f"Quantity: {quantity}. {notes}"
+        return f"Quantity: {quantity}."
+
     # ---------------------------------------------------------
     # API-level logs
     # ---------------------------------------------------------
@@ -80,16 +253,39 @@ class ActivityLogger:
         target_entity: str,
         user_id: Optional[Union[int, User]] = None,
         source: str = "API",
-        details: Optional[str] = None
+        details: Optional[str] = None,
+        wait: bool = False
     ):
         """
         Log API-level activity for broader system auditing.
-        """
-        user_obj = ActivityLogger._resolve_user(user_id)
 
+        By default the entry is queued and written in the background,
+        and None is returned. Pass wait=True to save it immediately and
+        get the APIActivityLog back.
+        """
         safe_method = (method or "").upper().strip() or "UNKNOWN"
         safe_target = (target_entity or "").strip() or "unknown"
 
+        if not wait:
+            user_ref = user_id
+            if user_ref is not None and not isinstance(user_ref, User):
+                try:
+                    user_ref = int(user_ref)
+                except (TypeError, ValueError):
+                    user_ref = None
+
+            _enqueue_api_log({
+                'method': safe_method,
+                'target_entity': safe_target,
+                'user': user_ref,
+                'source': source,
+                'details': details,
+                'timestamp': datetime.now(timezone.utc)
+            })
+            return None
+
+        user_obj = ActivityLogger._resolve_user(user_id)
+
         log = APIActivityLog(
             method=safe_method,
             target_entity=safe_target,
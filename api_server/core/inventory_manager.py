@@ -23,7 +23,7 @@ class InventoryManager:
     @staticmethod
     def get_stock(product_id: int) -> int:
         """Return total available stock for a product by summing all batches."""
-        product = Product.objects(id=product_id).first()
+        product = Product.objects(id=product_id).exclude('product_image').first()
         if not product:
             raise InventoryError("Product not found")
         return product.stock_level
@@ -34,7 +34,7 @@ class InventoryManager:
     @staticmethod
     def validate_stock(product_id: int, qty_needed: int) -> bool:
         """Raise InventoryError if Deducting would cause insufficient stock."""
-        product = Product.objects(id=product_id).first()
+        product = Product.objects(id=product_id).exclude('product_image').first()
         if not product:
             raise InventoryError("Product not found")
 
@@ -88,7 +88,7 @@ class InventoryManager:
         ✅ Returns a list of deductions:
             [{"batch_id": <int>, "quantity": <int>}, ...]
         """
-        product = Product.objects(id=product_id).first()
+        product = Product.objects(id=product_id).exclude('product_image').first()
         if not product:
             raise InventoryError("Product not found")
 
@@ -3,12 +3,14 @@
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.platypus import (
-    SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer,
+    SimpleDocTemplate, Table, LongTable, TableStyle, Paragraph, Spacer,
     Image, PageBreak, KeepTogether, HRFlowable
 )
 from datetime import datetime
+from functools import partial
 import os
 from io import BytesIO
+from tempfile import SpooledTemporaryFile
 
 from utils.pdf_styles import (
     PDFColors, PDFStyles, PDFTableStyles,
@@ -16,8 +18,25 @@ from utils.pdf_styles import (
 )
 
 
-def _footer_canvas(canvas, doc):
-    """Draw footer on every page at the bottom"""
+# Page setup shared by every report
+_LETTER_DOC_KWARGS = dict(
+    pagesize=letter,
+    topMargin=0.5 * inch,
+    bottomMargin=0.8 * inch,
+    leftMargin=0.75 * inch,
+    rightMargin=0.75 * inch
+)
+
+
+# "Generated on" timestamp format for the page footer
+_FOOTER_FMT = '%B %d, %Y at %I:%M %p'
+
+
+def _footer_canvas(canvas, doc, generated_on):
+    """
+    Draw footer on every page at the bottom.
+    generated_on is formatted once per document, not once per page.
+    """
     canvas.saveState()
 
     footer_y = doc.bottomMargin - 0.3 * inch
@@ -31,13 +50,12 @@ def _footer_canvas(canvas, doc):
         footer_y + 0.2 * inch
     )
 
-    timestamp = datetime.now().strftime('%B %d, %Y at %I:%M %p')
     canvas.setFont('Helvetica', 9)
     canvas.setFillColor(PDFColors.MEDIUM_GRAY)
     canvas.drawCentredString(
         (doc.width + doc.leftMargin + doc.rightMargin) / 2,
         footer_y,
-        f"Generated on {timestamp}"
+        f"Generated on {generated_on}"
     )
 
     footer_text = f"{PDFBranding.COMPANY_NAME} | {PDFBranding.BRANCH_NAME}"
@@ -55,12 +73,38 @@ class PDFReportGenerator:
     Professional PDF report generator for all 7 StockaDoodle reports
     """
 
+    # Fixed row heights (points) for row-heavy tables, matching the paddings
+    # in the standard table style so ReportLab can skip measuring each cell
+    HEADER_ROW_HEIGHT = 36
+    DATA_ROW_HEIGHT = 28
+
+    # Sales detail rows rendered in the Sales Performance PDF (~25 rows per
+    # page); the summary above the table still covers every sale
+    MAX_SALES_DETAIL_ROWS = 1000
+
+    # PDFs stay in memory up to this size, then spill to a temp file
+    OUTPUT_SPOOL_MAX_SIZE = 1024 * 1024
+
     def __init__(self):
         self.styles = self._init_styles()
 
+        # Table styles are read-only once built, so every table shares them
+        self._summary_table_style = PDFTableStyles.get_summary_table_style()
+        self._data_table_style = PDFTableStyles.get_standard_table_style()
+
+        # The logo never changes, so find and read it once
+        self._logo_bytes = self._load_logo_bytes()
+
     # ------------------------------------------------------------
     # Small helpers
     # ------------------------------------------------------------
+    def _new_output_buffer(self):
+        """
+        Buffer for a rendered PDF. Large reports are spooled to disk instead
+        of being held in memory for the lifetime of the response.
+        """
+        return SpooledTemporaryFile(max_size=self.OUTPUT_SPOOL_MAX_SIZE)
+
     @staticmethod
     def _money(value) -> str:
         """Format money consistently as Philippine Peso (₱)."""
@@ -95,8 +139,9 @@ class PDFReportGenerator:
             'metric_value': PDFStyles.get_metric_value_style()
         }
 
-    def _add_professional_header(self, elements):
-        """Add professional header with logo and company branding"""
+    @staticmethod
+    def _load_logo_bytes():
+        """Return the bytes of the first usable logo file, or None"""
         logo_paths = [
             PDFBranding.LOGO_PATH,
             PDFBranding.LOGO_FALLBACK_PATH,
@@ -107,13 +152,23 @@ class PDFReportGenerator:
         for logo_path in logo_paths:
             if os.path.exists(logo_path):
                 try:
-                    logo = Image(logo_path, width=1.5 * inch, height=1.5 * inch)
-                    logo.hAlign = 'CENTER'
-                    elements.append(logo)
-                    elements.append(PDFLayoutHelpers.create_spacer(0.1))
-                    break
+                    with open(logo_path, 'rb') as f:
+                        data = f.read()
+                    # make sure ReportLab can actually decode it
+                    Image(BytesIO(data), width=1.5 * inch, height=1.5 * inch)
+                    return data
                 except Exception:
                     continue
+        return None
+
+    def _add_professional_header(self, elements):
+        """Add professional header with logo and company branding"""
+        if self._logo_bytes:
+            # Flowables are single-use, so build a fresh Image from the cached bytes
+            logo = Image(BytesIO(self._logo_bytes), width=1.5 * inch, height=1.5 * inch)
+            logo.hAlign = 'CENTER'
+            elements.append(logo)
+            elements.append(PDFLayoutHelpers.create_spacer(0.1))
 
         company_para = Paragraph(
             f"<b>{PDFBranding.COMPANY_NAME}</b>",
@@ -145,15 +200,43 @@ class PDFReportGenerator:
         """Create styled summary metrics box"""
         data = [[label, value] for label, value in summary_data.items()]
         table = Table(data, colWidths=[3 * inch, 2.5 * inch])
-        table.setStyle(PDFTableStyles.get_summary_table_style())
+        table.setStyle(self._summary_table_style)
         return table
 
-    def _create_data_table(self, data, col_widths=None):
-        """Create professional data table"""
-        table = Table(data, colWidths=col_widths)
-        table.setStyle(PDFTableStyles.get_standard_table_style())
+    def _create_data_table(self, data, col_widths=None, fixed_rows=False):
+        """
+        Create professional data table.
+        fixed_rows=True uses a LongTable with fixed row heights, which skips
+        the per-cell height measurement pass on row-heavy reports.
+        """
+        if fixed_rows:
+            row_heights = [self.HEADER_ROW_HEIGHT] + [self.DATA_ROW_HEIGHT] * (len(data) - 1)
+            table = LongTable(data, colWidths=col_widths, rowHeights=row_heights, repeatRows=1)
+        else:
+            table = Table(data, colWidths=col_widths)
+        table.setStyle(self._data_table_style)
         return table
 
+    def _build_report(self, elements, title, subtitle=None):
+        """
+        Shared scaffolding for every report: branded header and title,
+        the report-specific body elements, the closing footer, and the
+        page footer canvas. Returns the rendered PDF buffer.
+        """
+        buffer = self._new_output_buffer()
+        doc = SimpleDocTemplate(buffer, **_LETTER_DOC_KWARGS)
+
+        story = []
+        self._add_professional_header(story)
+        self._add_report_title(story, title, subtitle)
+        story.extend(elements)
+        self._add_professional_footer(story)
+
+        footer = partial(_footer_canvas, generated_on=datetime.now().strftime(_FOOTER_FMT))
+        doc.build(story, onFirstPage=footer, onLaterPages=footer)
+        buffer.seek(0)
+        return buffer
+
     # ================================================================
     # REPORT 1 (Sales Performance)
     # ================================================================
@@ -162,25 +245,12 @@ class PDFReportGenerator:
         Report 1 PDF: Sales Performance Report
         Uses report_data from ReportGenerator.sales_performance_report()
         """
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch,
-            bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch,
-            rightMargin=0.75 * inch
-        )
         elements = []
 
-        self._add_professional_header(elements)
-
         start_date = (report_data.get('date_range') or {}).get('start')
         end_date = (report_data.get('date_range') or {}).get('end')
         date_range = f"{start_date} to {end_date}" if start_date and end_date else "Not specified"
 
-        # ✅ FIX: Correct title for Report 1
-        self._add_report_title(elements, "Sales Performance Report", f"Report Period: {date_range}")
-
         elements.append(Paragraph("Summary", self.styles['section']))
 
         summary = report_data.get('summary', {}) or {}
@@ -197,47 +267,43 @@ class PDFReportGenerator:
         if sales_rows:
             elements.append(Paragraph("Sales Details", self.styles['section']))
 
+            # Bind the formatters once; this loop runs once per sale line
+            money, safe_int = self._money, self._safe_int
             sales_data = [['Sale ID', 'Date', 'Product', 'Qty', 'Line Total', 'Retailer']]
-
-            for sale in sales_rows[:50]:
-                sales_data.append([
+            sales_data.extend(
+                [
                     str(sale.get('sale_id', 'N/A')),
-                    (sale.get('date', 'N/A') or 'N/A')[:10],
-                    (sale.get('product_name', 'N/A') or 'N/A')[:25],
-                    str(self._safe_int(sale.get('quantity_sold', 0))),
-                    self._money(sale.get('total_price', 0)),
-                    (sale.get('retailer_name', 'N/A') or 'N/A')[:20]
-                ])
-
-            sales_table = self._create_data_table(
-                sales_data,
-                col_widths=[0.7 * inch, 1.0 * inch, 2.1 * inch, 0.6 * inch, 1.1 * inch, 1.5 * inch]
+                    (sale.get('date') or 'N/A')[:10],
+                    (sale.get('product_name') or 'N/A')[:25],
+                    str(safe_int(sale.get('quantity_sold'))),
+                    money(sale.get('total_price')),
+                    (sale.get('retailer_name') or 'N/A')[:20]
+                ]
+                for sale in sales_rows[:self.MAX_SALES_DETAIL_ROWS]
             )
-            elements.append(sales_table)
+
+            # one LongTable: ReportLab splits it at each page break and repeats the header row
+            elements.append(self._create_data_table(
+                sales_data,
+                col_widths=[0.7 * inch, 1.0 * inch, 2.1 * inch, 0.6 * inch, 1.1 * inch, 1.5 * inch],
+                fixed_rows=True
+            ))
+            if len(sales_rows) > self.MAX_SALES_DETAIL_ROWS:
+                elements.append(Paragraph(
+                    f"Showing the first {self.MAX_SALES_DETAIL_ROWS} of {len(sales_rows)} sales lines.",
+                    self.styles['body']
+                ))
         else:
             elements.append(Paragraph("No sales found for the selected period.", self.styles['body']))
 
-        self._add_professional_footer(elements)
-
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+        return self._build_report(elements, "Sales Performance Report", f"Report Period: {date_range}")
 
     # ================================================================
     # REPORT 2 (Category Distribution)
     # ================================================================
     def generate_category_distribution_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
         elements = []
 
-        self._add_professional_header(elements)
-        self._add_report_title(elements, "Category Distribution Report")
-
         summary = report_data.get('summary', {}) or {}
         summary_text = {
             'Total Categories': str(self._safe_int(summary.get('total_categories', 0))),
@@ -264,27 +330,14 @@ class PDFReportGenerator:
         )
         elements.append(cat_table)
 
-        self._add_professional_footer(elements)
-
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+        return self._build_report(elements, "Category Distribution Report")
 
     # ================================================================
     # REPORT 3 (Retailer Performance)
     # ================================================================
     def generate_retailer_performance_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
         elements = []
 
-        self._add_professional_header(elements)
-        self._add_report_title(elements, "Retailer Performance Report")
-
         summary = report_data.get('summary', {}) or {}
         summary_text = {
             'Total Retailers': str(self._safe_int(summary.get('total_retailers', 0))),
@@ -314,27 +367,14 @@ class PDFReportGenerator:
         )
         elements.append(ret_table)
 
-        self._add_professional_footer(elements)
-
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+        return self._build_report(elements, "Retailer Performance Report")
 
     # ================================================================
     # REPORT 4 (Alerts)
     # ================================================================
     def generate_alerts_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
         elements = []
 
-        self._add_professional_header(elements)
-        self._add_report_title(elements, "Low-Stock & Expiration Alert Report")
-
         summary = report_data.get('summary', {}) or {}
         summary_text = {
             'Total Alerts': str(self._safe_int(summary.get('total_alerts', 0))),
@@ -347,49 +387,40 @@ class PDFReportGenerator:
         elements.append(PDFLayoutHelpers.create_spacer(0.3))
 
         elements.append(Paragraph("Alert Details", self.styles['section']))
+        alerts = report_data.get('alerts', []) or []
+        safe_int = self._safe_int
         alert_data = [['Product', 'Current Stock', 'Min Level', 'Expiration', 'Status', 'Severity']]
-
-        for alert in report_data.get('alerts', []) or []:
-            alert_data.append([
-                (alert.get('product_name', 'Unknown') or 'Unknown')[:30],
-                str(self._safe_int(alert.get('current_stock', 0))),
-                str(self._safe_int(alert.get('min_stock_level', 0))),
+        alert_data.extend(
+            [
+                (alert.get('product_name') or 'Unknown')[:30],
+                str(safe_int(alert.get('current_stock'))),
+                str(safe_int(alert.get('min_stock_level'))),
                 alert.get('expiration_date') or 'N/A',
-                alert.get('alert_status', '') or '',
-                alert.get('severity', '') or ''
-            ])
+                alert.get('alert_status') or '',
+                alert.get('severity') or ''
+            ]
+            for alert in alerts
+        )
 
         alert_table = self._create_data_table(
             alert_data,
-            col_widths=[2 * inch, 1 * inch, 0.9 * inch, 1 * inch, 1.5 * inch, 0.8 * inch]
+            col_widths=[2 * inch, 1 * inch, 0.9 * inch, 1 * inch, 1.5 * inch, 0.8 * inch],
+            fixed_rows=True
         )
-        elements.append(alert_table)
 
-        self._add_professional_footer(elements)
+        elements.append(alert_table)
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+        return self._build_report(elements, "Low-Stock & Expiration Alert Report")
 
     # ================================================================
     # REPORT 5 (Managerial Activity)
     # ================================================================
     def generate_managerial_activity_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
         elements = []
 
-        self._add_professional_header(elements)
-
         dr = report_data.get('date_range', {}) or {}
         date_range = f"{dr.get('start', '')} to {dr.get('end', '')}".strip()
 
-        self._add_report_title(elements, "Managerial Activity Log Report", f"Report Period: {date_range}")
-
         summary = report_data.get('summary', {}) or {}
         summary_text = {
             'Total Actions': str(self._safe_int(summary.get('total_actions', 0))),
@@ -402,44 +433,32 @@ class PDFReportGenerator:
 
         elements.append(Paragraph("Activity Log", self.styles['section']))
         log_data = [['Log ID', 'Product', 'Action', 'Manager', 'Date/Time']]
-
-        for log in (report_data.get('logs', []) or [])[:100]:
-            log_data.append([
+        log_data.extend(
+            [
                 str(log.get('log_id', '')),
-                (log.get('product_name', 'Unknown') or 'Unknown')[:25],
-                log.get('action_performed', '') or '',
-                (log.get('manager_name', 'Unknown') or 'Unknown')[:20],
-                (log.get('date_time', '') or '')[:16]
-            ])
+                (log.get('product_name') or 'Unknown')[:25],
+                log.get('action_performed') or '',
+                (log.get('manager_name') or 'Unknown')[:20],
+                (log.get('date_time') or '')[:16]
+            ]
+            for log in (report_data.get('logs', []) or [])[:100]
+        )
 
         log_table = self._create_data_table(
             log_data,
-            col_widths=[0.7 * inch, 2 * inch, 1.3 * inch, 1.5 * inch, 1.5 * inch]
+            col_widths=[0.7 * inch, 2 * inch, 1.3 * inch, 1.5 * inch, 1.5 * inch],
+            fixed_rows=True
         )
         elements.append(log_table)
 
-        self._add_professional_footer(elements)
-
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+        return self._build_report(elements, "Managerial Activity Log Report", f"Report Period: {date_range}")
 
     # ================================================================
     # REPORT 6 (Detailed Transactions)
     # ================================================================
     def generate_transactions_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
         elements = []
 
-        self._add_professional_header(elements)
-
-        self._add_report_title(elements, "Detailed Sales Transaction Report")
-
         summary = report_data.get('summary', {}) or {}
         summary_text = {
             'Total Revenue': self._money(summary.get('total_revenue', 0)),
@@ -461,18 +480,20 @@ class PDFReportGenerator:
         elements.append(PDFLayoutHelpers.create_spacer(0.3))
 
         elements.append(Paragraph("Sales Breakdown", self.styles['section']))
+        money, safe_int = self._money, self._safe_int
         sales_data = [['Sale ID', 'Product', 'Brand', 'Qty', 'Unit Price', 'Line Total', 'Retailer']]
-
-        for transaction in (report_data.get('transactions', []) or [])[:100]:
-            sales_data.append([
+        sales_data.extend(
+            [
                 str(transaction.get('sale_id', '')),
-                (transaction.get('product_name', 'Unknown') or 'Unknown')[:30],
-                (transaction.get('product_brand', '') or '')[:15],
-                str(self._safe_int(transaction.get('quantity_sold', 0))),
-                self._money(transaction.get('unit_price', 0)),
-                self._money(transaction.get('line_total', 0)),
-                (transaction.get('retailer_name', 'Unknown') or 'Unknown')[:25]
-            ])
+                (transaction.get('product_name') or 'Unknown')[:30],
+                (transaction.get('product_brand') or '')[:15],
+                str(safe_int(transaction.get('quantity_sold'))),
+                money(transaction.get('unit_price')),
+                money(transaction.get('line_total')),
+                (transaction.get('retailer_name') or 'Unknown')[:25]
+            ]
+            for transaction in (report_data.get('transactions', []) or [])[:100]
+        )
 
         sales_table = self._create_data_table(
             sales_data,
@@ -480,27 +501,14 @@ class PDFReportGenerator:
         )
         elements.append(sales_table)
 
-        self._add_professional_footer(elements)
-
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+        return self._build_report(elements, "Detailed Sales Transaction Report")
 
     # ================================================================
     # REPORT 7 (User Accounts)
     # ================================================================
     def generate_user_accounts_report(self, report_data):
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer, pagesize=letter,
-            topMargin=0.5 * inch, bottomMargin=0.8 * inch,
-            leftMargin=0.75 * inch, rightMargin=0.75 * inch
-        )
         elements = []
 
-        self._add_professional_header(elements)
-        self._add_report_title(elements, "User Accounts Report")
-
         summary = report_data.get('summary', {}) or {}
         summary_text = {
             'Total Users': str(self._safe_int(summary.get('total_users', 0))),
@@ -531,8 +539,17 @@ class PDFReportGenerator:
         )
         elements.append(user_table)
 
-        self._add_professional_footer(elements)
+        return self._build_report(elements, "User Accounts Report")
 
-        doc.build(elements, onFirstPage=_footer_canvas, onLaterPages=_footer_canvas)
-        buffer.seek(0)
-        return buffer
+
+# Shared generator instance; styles are read-only after __init__, so one
+# instance can serve every request
+_instance = None
+
+
+def get_generator():
+    """Return the shared PDFReportGenerator, creating it on first use"""
+    global _instance
+    if _instance is None:
+        _instance = PDFReportGenerator()
+    return _instance
@@ -27,6 +27,32 @@ class ReportGenerator:
     def _date_to_end_datetime(d: date):
         return datetime.combine(d, datetime.max.time())
 
+    # Batch lookups: one query per report instead of one per row
+
+    @staticmethod
+    def _users_by_id(user_ids):
+        ids = list({uid for uid in user_ids if uid is not None})
+        if not ids:
+            return {}
+        return {u.id: u for u in User.objects(id__in=ids).only('id', 'full_name', 'role')}
+
+    @staticmethod
+    def _products_by_id(product_ids):
+        ids = list({pid for pid in product_ids if pid is not None})
+        if not ids:
+            return {}
+        return {p.id: p for p in Product.objects(id__in=ids).only('id', 'name', 'brand')}
+
+    @staticmethod
+    def _stock_levels_by_product():
+        """Total batch quantity per product_id, in one grouped query"""
+        return {
+            row['_id']: int(row['total'] or 0)
+            for row in StockBatch.objects.aggregate([
+                {'$group': {'_id': '$product_id', 'total': {'$sum': '$quantity'}}}
+            ])
+        }
+
     # ------------------------------------------------------------
     # REPORT 1
     # ------------------------------------------------------------
@@ -55,14 +81,19 @@ class ReportGenerator:
         if end_date:
             sales = sales.filter(created_at__lte=ReportGenerator._date_to_end_datetime(end_date))
 
-        sales = sales.order_by('-created_at')
+        sales = list(sales.order_by('-created_at'))
+
+        retailers = ReportGenerator._users_by_id(sale.retailer_id for sale in sales)
+        products = ReportGenerator._products_by_id(
+            item.product_id for sale in sales for item in (sale.items or [])
+        )
 
         results = []
         for sale in sales:
-            retailer = User.objects(id=sale.retailer_id).first()
+            retailer = retailers.get(sale.retailer_id)
 
             for item in (sale.items or []):
-                product = Product.objects(id=item.product_id).first()
+                product = products.get(item.product_id)
 
                 qty = int(item.quantity or 0)
                 line_total = float(item.line_total or 0)
@@ -108,19 +139,24 @@ class ReportGenerator:
         """
         categories = list(Category.objects())
 
-        all_products = list(Product.objects())
-        total_stock = sum(int(p.stock_level or 0) for p in all_products)
+        # One pass over products and one grouped query over stock batches,
+        # instead of one product query per category
+        all_products = list(Product.objects().only('id', 'category_id'))
+        stock_by_product = ReportGenerator._stock_levels_by_product()
+
+        products_by_category = {}
+        for p in all_products:
+            products_by_category.setdefault(p.category_id, []).append(p)
+
+        total_stock = sum(stock_by_product.get(p.id, 0) for p in all_products)
 
         category_data = []
-        categorized_product_ids = set()
 
         for category in categories:
-            products = list(Product.objects(category_id=category.id))
-            for p in products:
-                categorized_product_ids.add(p.id)
+            products = products_by_category.get(category.id, [])
 
             products_count = len(products)
-            category_stock = sum(int(p.stock_level or 0) for p in products)
+            category_stock = sum(stock_by_product.get(p.id, 0) for p in products)
             percentage = (category_stock / total_stock * 100) if total_stock > 0 else 0
 
             category_data.append({
@@ -134,7 +170,7 @@ class ReportGenerator:
         # Optional but useful: include uncategorized bucket
         uncategorized_products = [p for p in all_products if not p.category_id]
         if uncategorized_products:
-            uncategorized_stock = sum(int(p.stock_level or 0) for p in uncategorized_products)
+            uncategorized_stock = sum(stock_by_product.get(p.id, 0) for p in uncategorized_products)
             percentage = (uncategorized_stock / total_stock * 100) if total_stock > 0 else 0
 
             category_data.append({
@@ -223,30 +259,37 @@ class ReportGenerator:
         """
         Report 4: Low-Stock and Expiration Alert Report
         """
-        products = Product.objects()
+        products = Product.objects().only('id', 'name', 'min_stock_level')
         alerts = []
 
         cutoff_date = date.today() + timedelta(days=int(days_ahead or 7))
 
+        stock_by_product = ReportGenerator._stock_levels_by_product()
+
+        # earliest expiring (non-empty) batch per product, in one grouped query
+        earliest_expiry_by_product = {}
+        for row in StockBatch.objects(
+            expiration_date__lte=cutoff_date,
+            expiration_date__ne=None,
+            quantity__gt=0
+        ).aggregate([
+            {'$group': {'_id': '$product_id', 'earliest': {'$min': '$expiration_date'}}}
+        ]):
+            earliest = row['earliest']
+            earliest_expiry_by_product[row['_id']] = (
+                earliest.date() if isinstance(earliest, datetime) else earliest
+            )
+
         for product in products:
-            stock = int(product.stock_level or 0)
+            stock = stock_by_product.get(product.id, 0)
             alert_status = []
 
             if stock < int(product.min_stock_level or 0):
                 alert_status.append("OUT_OF_STOCK" if stock == 0 else "LOW_STOCK")
 
-            expiring_batches = StockBatch.objects(
-                product_id=product.id,
-                expiration_date__lte=cutoff_date,
-                expiration_date__ne=None,
-                quantity__gt=0
-            )
-
-            if expiring_batches.count() > 0:
+            earliest_expiry = earliest_expiry_by_product.get(product.id)
+            if earliest_expiry:
                 alert_status.append("EXPIRING_SOON")
-                earliest_expiry = min(batch.expiration_date for batch in expiring_batches)
-            else:
-                earliest_expiry = None
 
             if alert_status:
                 alerts.append({
@@ -286,10 +329,13 @@ class ReportGenerator:
         start_datetime = ReportGenerator._date_to_start_datetime(start_date)
         end_datetime = ReportGenerator._date_to_end_datetime(end_date)
 
-        all_logs = ProductLog.objects(
+        # select_related dereferences every log.user in one batched query
+        all_logs = list(ProductLog.objects(
             log_time__gte=start_datetime,
             log_time__lte=end_datetime
-        ).order_by('-log_time')
+        ).order_by('-log_time').select_related())
+
+        products = ReportGenerator._products_by_id(log.product_id for log in all_logs)
 
         results = []
         unique_managers = set()
@@ -303,7 +349,7 @@ class ReportGenerator:
             if user.role not in ['admin', 'manager']:
                 continue
 
-            product = Product.objects(id=log.product_id).first()
+            product = products.get(log.product_id)
 
             results.append({
                 'log_id': log.id,
@@ -354,17 +400,22 @@ class ReportGenerator:
         if end_date:
             sales = sales.filter(created_at__lte=ReportGenerator._date_to_end_datetime(end_date))
 
-        sales = sales.order_by('-created_at')
+        sales = list(sales.order_by('-created_at'))
+
+        retailers = ReportGenerator._users_by_id(sale.retailer_id for sale in sales)
+        products = ReportGenerator._products_by_id(
+            item.product_id for sale in sales for item in (sale.items or [])
+        )
 
         transactions = []
         total_revenue = 0.0
         total_items = 0
 
         for sale in sales:
-            retailer = User.objects(id=sale.retailer_id).first()
+            retailer = retailers.get(sale.retailer_id)
 
             for item in (sale.items or []):
-                product = Product.objects(id=item.product_id).first()
+                product = products.get(item.product_id)
 
                 qty = int(item.quantity or 0)
                 line_total = float(item.line_total or 0)
@@ -385,7 +385,7 @@ class SalesManager:
             except Exception:
                 sale_date = None
 
-            retailer_user = User.objects(id=retailer_id).first()
+            retailer_user = User.objects(id=retailer_id).exclude('user_image').first()
             metrics = RetailerMetrics.objects(retailer=retailer_user).first() if retailer_user else None
 
             if metrics:
@@ -465,7 +465,7 @@ class SalesManager:
 
             rid = int(sale.retailer_id)
             if rid not in user_cache:
-                u = User.objects(id=rid).first()
+                u = User.objects(id=rid).only('full_name').first()
                 user_cache[rid] = u.full_name if u else "Unknown"
             retailer_name = user_cache.get(rid, "Unknown")
 
@@ -486,7 +486,7 @@ class SalesManager:
 
                 pid = int(item.product_id)
                 if pid not in product_cache:
-                    p = Product.objects(id=pid).first()
+                    p = Product.objects(id=pid).only('name').first()
                     product_cache[pid] = p.name if p else f"Product #{pid}"
                 product_name = product_cache.get(pid, f"Product #{pid}")
 
@@ -598,25 +598,30 @@ class SalesManager:
 
         from models.user import User
 
-        user = User.objects(id=int(retailer_id)).first()
+        user = User.objects(id=int(retailer_id)).only('id').first()
         if not user:
             raise SalesError(f"Retailer ID {retailer_id} not found")
 
-        metrics = RetailerMetrics.objects(retailer=user).first()
+        # Single findAndModify: sets the quota and hands back the old document
+        metrics = RetailerMetrics.objects(retailer=user).modify(
+            new=False,
+            set__daily_quota=float(new_quota)
+        )
 
-        if not metrics:
+        if metrics:
+            old_quota = float(metrics.daily_quota or 0)
+            metrics.daily_quota = float(new_quota)
+        else:
             metrics = RetailerMetrics(
                 retailer=user,
-                daily_quota=1000.0,
+                daily_quota=float(new_quota),
                 sales_today=0.0,
                 total_sales=0.0,
                 total_transactions=0,
                 current_streak=0
             )
-
-        old_quota = float(metrics.daily_quota or 0)
-        metrics.daily_quota = float(new_quota)
-        metrics.save()
+            metrics.save()
+            old_quota = 1000.0
 
         ActivityLogger.log_api_activity(
             method="PATCH",
@@ -633,23 +638,24 @@ class SalesManager:
         Reset daily metrics for all retailers (run at midnight).
         Updates streaks based on quota achievement.
         """
-        all_metrics = RetailerMetrics.objects()
         today = date.today()
         yesterday = today - timedelta(days=1)
 
-        updated_count = 0
+        # Server-side bulk updates instead of loading and saving each document.
+        # Streaks are settled first, since they read sales_today.
+        met_quota = {'$expr': {'$gte': ['$sales_today', '$daily_quota']}}
+        missed_quota = {'$expr': {'$lt': ['$sales_today', '$daily_quota']}}
 
-        for metrics in all_metrics:
-            if metrics.last_sale_date == yesterday:
-                if metrics.sales_today >= metrics.daily_quota:
-                    metrics.current_streak += 1
-                else:
-                    metrics.current_streak = 0
-            elif metrics.last_sale_date and metrics.last_sale_date < yesterday:
-                metrics.current_streak = 0
+        RetailerMetrics.objects(last_sale_date=yesterday, __raw__=met_quota).update(
+            inc__current_streak=1
+        )
+        RetailerMetrics.objects(last_sale_date=yesterday, __raw__=missed_quota).update(
+            set__current_streak=0
+        )
+        RetailerMetrics.objects(last_sale_date__lt=yesterday).update(
+            set__current_streak=0
+        )
 
-            metrics.sales_today = 0.0
-            metrics.save()
-            updated_count += 1
+        updated_count = RetailerMetrics.objects().update(set__sales_today=0.0)
 
         return updated_count
@@ -36,6 +36,10 @@ class UserManager:
             raise UserError("Account is deactivated. Please contact your administrator.")
         
         if user.check_password(password):
+            # upgrade legacy hashes to argon2 while we have the plain password
+            if user.needs_rehash():
+                user.set_password(password)
+                user.save()
             return user
         
         return None
@@ -1,4 +1,5 @@
 import base64
+from flask import url_for
 from mongoengine import StringField, BinaryField
 from .base import BaseDocument
 
@@ -17,15 +18,30 @@ class Category(BaseDocument):
     # optional image for the category
     category_image = BinaryField()
      
-    def to_dict(self, include_image=False):
+    def to_dict(self, include_image=False, has_image=None):
+        # include_image is kept for existing callers; the image itself is
+        # always referenced through image_url rather than inlined.
+        # has_image lets callers that excluded category_image from the
+        # query pass in whether an image exists
+        if has_image is None:
+            has_image = bool(self.category_image)
+
         data = {
             'id': self.id,
             'name': self.name,
-            'description': self.description
+            'description': self.description,
+            'has_image': has_image
         }
-        
-        if include_image and self.category_image:
-            # return image as binary data
-            data['image_data'] = base64.b64encode(self.category_image).decode('utf-8')
-        
-        return data
\ No newline at end of file
+
+        if has_image:
+            # image bytes are served by their own cacheable endpoint
+            data['image_url'] = url_for('categories.get_category_image', cat_id=self.id)
+
+        return data
+
+    def to_dict_with_inline_image(self):
+        # for callers that really need the bytes in the JSON body
+        data = self.to_dict()
+        if self.category_image:
+            data['image_data'] = base64.b64encode(memoryview(self.category_image)).decode('ascii')
+        return data
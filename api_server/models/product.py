@@ -8,12 +8,20 @@ from mongoengine import StringField, IntField, BinaryField
 class Product(BaseDocument):
     meta = {
         'collection': 'products',
-        'ordering': ['name']
+        'ordering': ['name'],
+        # name already has a unique index; category filters are the other hot path
+        'indexes': [
+            ('category_id', 'name'),
+            'name_lower'
+        ]
     }
 
     # name of the product, must be unique
     name = StringField(max_length=120, unique=True, required=True)
 
+    # lowercased copy of name for case-insensitive search, kept in sync by clean()
+    name_lower = StringField(max_length=120)
+
     # simple brand text
     brand = StringField(max_length=50)
 
@@ -32,6 +40,9 @@ class Product(BaseDocument):
     # longer description of the product, optional
     details = StringField(max_length=250)
 
+    def clean(self):
+        self.name_lower = self.name.lower() if self.name else None
+
     @property
     def stock_level(self):
         """
@@ -53,7 +64,9 @@ class Product(BaseDocument):
         from .category import Category
         return Category.objects(id=self.category_id).first() if self.category_id else None
 
-    def to_dict(self, include_image=False, include_batches=False):
+    def to_dict(self, include_image=False, include_batches=False, has_image=None):
+        # has_image lets callers that excluded product_image from the query
+        # pass in whether an image exists
         category_obj = self.category
 
         data = {
@@ -72,7 +85,7 @@ class Product(BaseDocument):
             "stock_level": self.stock_level,
             "min_stock_level": self.min_stock_level,
             "details": self.details or "",
-            "has_image": bool(self.product_image)
+            "has_image": bool(self.product_image) if has_image is None else has_image
         }
 
         if include_image and self.product_image:
@@ -10,7 +10,11 @@ class StockBatch(BaseDocument):
     meta = {
         'collection': 'stock_batches',
         # Keep ordering, but FEFO manager should still override with safer logic
-        'ordering': ['expiration_date']
+        'ordering': ['expiration_date'],
+        # every stock level and FEFO lookup filters by product
+        'indexes': [
+            ('product_id', 'expiration_date')
+        ]
     }
 
     # product this batch belongs to
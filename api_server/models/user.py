@@ -1,13 +1,24 @@
 import base64
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import url_for
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
+from werkzeug.security import check_password_hash
 from mongoengine import StringField, EmailField, BooleanField, DateTimeField, BinaryField
 from .base import BaseDocument
 from datetime import datetime, timezone
 
+# argon2id hasher shared by all users (stateless, safe to reuse)
+_password_hasher = PasswordHasher()
+
 class User(BaseDocument):
     meta = {
         'collection': 'users',
-        'ordering': ['username']
+        'ordering': ['username'],
+        # username/email already get unique indexes from their fields;
+        # this one covers the role + active filter used by user listings
+        'indexes': [
+            ('role', 'is_active')
+        ]
         }
     
     # full name for display
@@ -36,13 +47,29 @@ class User(BaseDocument):
 
     def set_password(self, password):
         # turn plain password into hashed password
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = _password_hasher.hash(password)
 
     def check_password(self, password):
         # check if password is correct
+        if not self.password_hash:
+            return False
+        if self.password_hash.startswith('$argon2'):
+            try:
+                return _password_hasher.verify(self.password_hash, password)
+            except (VerificationError, InvalidHashError):
+                return False
+        # older accounts still carry werkzeug (pbkdf2/scrypt) hashes
         return check_password_hash(self.password_hash, password)
 
+    def needs_rehash(self):
+        # true for legacy werkzeug hashes or outdated argon2 parameters
+        if not self.password_hash or not self.password_hash.startswith('$argon2'):
+            return True
+        return _password_hasher.check_needs_rehash(self.password_hash)
+
     def to_dict(self, include_image=False):
+        # include_image is kept for existing callers; the image itself is
+        # always referenced through image_url rather than inlined
         data = {
             "id": self.id,
             "full_name": self.full_name,
@@ -52,8 +79,15 @@ class User(BaseDocument):
             "has_image": bool(self.user_image)
         }
 
-        if include_image and self.user_image:
-            # return user image as binary data
-            data["image_data"] = base64.b64encode(self.user_image).decode('utf-8')
+        if self.user_image:
+            # image bytes are served by their own cacheable endpoint
+            data["image_url"] = url_for('users.get_user_image', user_id=self.id)
+
+        return data
 
+    def to_dict_with_inline_image(self):
+        # for callers that really need the bytes in the JSON body
+        data = self.to_dict()
+        if self.user_image:
+            data["image_data"] = base64.b64encode(memoryview(self.user_image)).decode('ascii')
         return data
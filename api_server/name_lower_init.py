@@ -0,0 +1,23 @@
+"""
+One-time script to backfill products.name_lower for product search.
+"""
+
+from pymongo import MongoClient, UpdateOne
+from config import Config
+
+client = MongoClient(Config.MONGO_URI)
+db = client[Config.DATABASE_NAME]
+
+# lowercase in Python so stored values match Product.clean() exactly
+updates = [
+    UpdateOne({"_id": doc["_id"]}, {"$set": {"name_lower": doc["name"].lower()}})
+    for doc in db.products.find({"name": {"$type": "string"}}, {"name": 1})
+]
+
+if updates:
+    db.products.bulk_write(updates, ordered=False)
+
+db.products.create_index("name_lower")
+
+print(f"Backfilled name_lower on {len(updates)} products")
+print("\nProduct search index ready for StockaDoodle IMS")
@@ -1,12 +1,37 @@
-from .products import bp as products_bp
-from .category import bp as categories_bp
-from .logs import bp as logs_bp
-from .sales import bp as sales_bp
-from .users import bp as users_bp
-from .dashboard import bp as dashboard_bp
-from .metrics import bp as metrics_bp
-from .reports import bp as reports_bp
-from .notifications import bp as notifications_bp
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .products import bp as products_bp
+    from .category import bp as categories_bp
+    from .logs import bp as logs_bp
+    from .sales import bp as sales_bp
+    from .users import bp as users_bp
+    from .dashboard import bp as dashboard_bp
+    from .metrics import bp as metrics_bp
+    from .reports import bp as reports_bp
+    from .notifications import bp as notifications_bp
+
+
+# blueprint name -> module, imported only when the blueprint is asked for
+_BLUEPRINT_MODULES = {
+    'products_bp': '.products',
+    'categories_bp': '.category',
+    'logs_bp': '.logs',
+    'sales_bp': '.sales',
+    'users_bp': '.users',
+    'dashboard_bp': '.dashboard',
+    'metrics_bp': '.metrics',
+    'reports_bp': '.reports',
+    'notifications_bp': '.notifications',
+}
+
+
+def __getattr__(name):
+    if name in _BLUEPRINT_MODULES:
+        module = importlib.import_module(_BLUEPRINT_MODULES[name], __name__)
+        return module.bp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = [
@@ -19,4 +44,4 @@ __all__ = [
     'metrics_bp',
     'reports_bp',
     'notifications_bp'
-    ]
\ No newline at end of file
+    ]
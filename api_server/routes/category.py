@@ -1,29 +1,38 @@
 from __future__ import annotations
 
 import io
-import imghdr
 
 from flask import Blueprint, request, jsonify, send_file
-from mongoengine.errors import DoesNotExist
 
 from models.category import Category
 from core.activity_logger import ActivityLogger
-from utils import get_image_binary
+from utils import get_image_binary, detect_image_mimetype, get_request_data, conditional_json
 
 bp = Blueprint('categories', __name__)
 
 
-def _detect_image_mimetype(blob: bytes) -> tuple[str, str]:
-    kind = imghdr.what(None, h=blob)
-    if kind in ("jpeg", "jpg"):
-        return "image/jpeg", "jpg"
-    if kind == "png":
-        return "image/png", "png"
-    if kind == "gif":
-        return "image/gif", "gif"
-    if kind == "webp":
-        return "image/webp", "webp"
-    return "application/octet-stream", "bin"
+def _check_category_name(name, exclude_id=None, missing="Category name is required"):
+    """
+    Validate a submitted category name: present, non-blank and unique
+
+    Args:
+        name: Raw value from the request payload
+        exclude_id: Category being updated, ignored in the uniqueness check
+        missing: Error message for an empty name
+
+    Returns:
+        tuple: (stripped name, None) or (None, error message)
+    """
+    name = name.strip() if isinstance(name, str) else ""
+    if not name:
+        return None, missing
+
+    query = Category.objects(name__iexact=name)
+    if exclude_id is not None:
+        query = query.filter(id__ne=exclude_id)
+    if query.only('id').first() is not None:
+        return None, "Category name already exists"
+    return name, None
 
 
 # ----------------------------------------------------------------------
@@ -32,12 +41,15 @@ def _detect_image_mimetype(blob: bytes) -> tuple[str, str]:
 @bp.route('', methods=['GET'])
 def list_categories():
     include_image = request.args.get('include_image', 'false').lower() == 'true'
-    categories = Category.objects().order_by('name')
 
-    return jsonify({
+    # Images are referenced by image_url, so the blobs never need loading here
+    categories = list(Category.objects().exclude('category_image').order_by('name'))
+    with_image = set(Category.objects(category_image__ne=None).distinct('id'))
+
+    return conditional_json({
         'total': len(categories),
-        'categories': [c.to_dict(include_image) for c in categories]
-    }), 200
+        'categories': [c.to_dict(include_image, has_image=c.id in with_image) for c in categories]
+    })
 
 
 # ----------------------------------------------------------------------
@@ -47,12 +59,13 @@ def list_categories():
 def get_category(cat_id):
     include_image = request.args.get('include_image', 'false').lower() == 'true'
 
-    try:
-        category = Category.objects.get(id=cat_id)
-    except DoesNotExist:
+    category = Category.objects.with_id(cat_id)
+    if category is None:
         return jsonify({"errors": ["Category not found"]}), 404
 
-    return jsonify(category.to_dict(include_image=include_image)), 200
+    if include_image:
+        return conditional_json(category.to_dict_with_inline_image())
+    return conditional_json(category.to_dict())
 
 
 # ----------------------------------------------------------------------
@@ -60,16 +73,15 @@ def get_category(cat_id):
 # ----------------------------------------------------------------------
 @bp.route('/<int:cat_id>/image', methods=['GET'])
 def get_category_image(cat_id: int):
-    try:
-        category = Category.objects.get(id=cat_id)
-    except DoesNotExist:
+    category = Category.objects.with_id(cat_id)
+    if category is None:
         return jsonify({"errors": ["Category not found"]}), 404
 
     blob = category.category_image
     if not blob:
         return jsonify({"errors": ["No category image"]}), 404
 
-    mimetype, ext = _detect_image_mimetype(blob)
+    mimetype, ext = detect_image_mimetype(blob)
 
     resp = send_file(
         io.BytesIO(blob),
@@ -86,21 +98,17 @@ def get_category_image(cat_id: int):
 # ----------------------------------------------------------------------
 @bp.route('', methods=['POST'])
 def create_category():
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
-    name = data.get('name')
-    if not name:
-        return jsonify({"errors": ["Category name is required"]}), 400
-
-    if Category.objects(name__iexact=name.strip()).first():
-        return jsonify({"errors": ["Category name already exists"]}), 400
+    name, error = _check_category_name(data.get('name'))
+    if error:
+        return jsonify({"errors": [error]}), 400
 
     image_blob = get_image_binary()
 
     try:
         category = Category(
-            name=name.strip(),
+            name=name,
             description=data.get('description'),
             category_image=image_blob
         )
@@ -126,27 +134,20 @@ def create_category():
 # ----------------------------------------------------------------------
 @bp.route('/<int:cat_id>', methods=['PUT'])
 def replace_category(cat_id):
-    try:
-        category = Category.objects.get(id=cat_id)
-    except DoesNotExist:
+    category = Category.objects.with_id(cat_id)
+    if category is None:
         return jsonify({"errors": ["Category not found"]}), 404
 
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
-    name = data.get('name')
-    if not name:
-        return jsonify({"errors": ["Category name is required for PUT"]}), 400
-
-    existing = Category.objects(
-        name__iexact=name.strip(),
-        id__ne=cat_id
-    ).first()
-    if existing:
-        return jsonify({"errors": ["Category name already exists"]}), 400
+    name, error = _check_category_name(
+        data.get('name'), exclude_id=cat_id, missing="Category name is required for PUT"
+    )
+    if error:
+        return jsonify({"errors": [error]}), 400
 
     old_name = category.name
-    category.name = name.strip()
+    category.name = name
     category.description = data.get('description')
 
     new_image = get_image_binary()
@@ -174,30 +175,24 @@ def replace_category(cat_id):
 # ----------------------------------------------------------------------
 @bp.route('/<int:cat_id>', methods=['PATCH'])
 def update_category(cat_id):
-    try:
-        category = Category.objects.get(id=cat_id)
-    except DoesNotExist:
+    category = Category.objects.with_id(cat_id)
+    if category is None:
         return jsonify({"errors": ["Category not found"]}), 404
 
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
     changes = []
     user_id = data.get('user_id')
 
     if 'name' in data:
-        if not data['name']:
-            return jsonify({"errors": ["Category name cannot be empty"]}), 400
-
-        existing = Category.objects(
-            name__iexact=data['name'].strip(),
-            id__ne=cat_id
-        ).first()
-        if existing:
-            return jsonify({"errors": ["Category name already exists"]}), 400
+        name, error = _check_category_name(
+            data['name'], exclude_id=cat_id, missing="Category name cannot be empty"
+        )
+        if error:
+            return jsonify({"errors": [error]}), 400
 
-        changes.append(f"name: {category.name} → {data['name']}")
-        category.name = data['name'].strip()
+        changes.append(f"name: {category.name} → {name}")
+        category.name = name
 
     if 'description' in data:
         changes.append("description updated")
@@ -234,18 +229,18 @@ def update_category(cat_id):
 def delete_category(cat_id):
     data = request.get_json(silent=True) or {}
 
-    try:
-        category = Category.objects.get(id=cat_id)
-    except DoesNotExist:
+    category = Category.objects.with_id(cat_id)
+    if category is None:
         return jsonify({"errors": ["Category not found"]}), 404
 
     user_id = data.get("user_id")
 
     from models.product import Product
-    if Product.objects(category_id=cat_id).first():
-        count = Product.objects(category_id=cat_id).count()
+    # single server-side count; no product documents are loaded
+    product_count = Product.objects(category_id=cat_id).count()
+    if product_count > 0:
         return jsonify({
-            "errors": [f"Cannot delete category while it has {count} linked products"]
+            "errors": [f"Cannot delete category while it has {product_count} linked products"]
         }), 400
 
     category_name = category.name
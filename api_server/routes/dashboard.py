@@ -111,14 +111,14 @@ def manager_dashboard():
 def retailer_dashboard(user_id):
     """Retailer Dashboard Metrics"""
     try:
-        user = User.objects(id=user_id).first()
+        user = User.objects(id=user_id).exclude('user_image').first()
         if not user:
             return jsonify({"errors": ["User not found"]}), 404
 
         if user.role not in ['retailer', 'staff']:
             return jsonify({"errors": ["User is not a retailer"]}), 403
 
-        all_products = Product.objects()
+        all_products = Product.objects().exclude('product_image')
         available_products = sum(1 for p in all_products if p.stock_level > 0)
 
         metrics = RetailerMetrics.objects(retailer=user).first()
@@ -171,7 +171,8 @@ def log_desktop_action():
             target_entity=target_entity,
             user_id=user_id,
             source='Desktop App',
-            details=details or f"Desktop action: {action_type}"
+            details=details or f"Desktop action: {action_type}",
+            wait=True  # the response includes the saved log
         )
 
         return jsonify({
@@ -1,14 +1,67 @@
 # api_server/routes/metrics.py
 
+import threading
+import time
+from collections import OrderedDict
+
 from flask import Blueprint, request, jsonify
 from models.user import User
 from models.retailer_metrics import RetailerMetrics  # kept for compatibility
 from core.sales_manager import SalesManager
 from core.activity_logger import ActivityLogger
+from utils import conditional_json
 
 bp = Blueprint('metrics', __name__)
 
 
+# ----------------------------------------------------------------------
+# Short TTL cache for the read-only metrics endpoints.
+# Only GETs populate it; quota updates, daily resets and sales clear it.
+# ----------------------------------------------------------------------
+CACHE_TTL_SECONDS = 30
+CACHE_MAX_ENTRIES = 256
+
+# leaderboard ?limit= is clamped to this range (it is also part of the cache key)
+LEADERBOARD_MAX_LIMIT = 100
+
+_cache = OrderedDict()  # key -> (expires_at, payload), oldest insert first
+_cache_lock = threading.Lock()
+
+
+def _cache_get(key):
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del _cache[key]
+            return None
+        return entry[1]
+
+
+def _cache_set(key, payload):
+    now = time.monotonic()
+    with _cache_lock:
+        _cache.pop(key, None)
+        if len(_cache) >= CACHE_MAX_ENTRIES:
+            # all entries share one TTL, so expired ones sit at the front
+            while _cache and next(iter(_cache.values()))[0] < now:
+                _cache.popitem(last=False)
+            if len(_cache) >= CACHE_MAX_ENTRIES:
+                _cache.popitem(last=False)
+        _cache[key] = (now + CACHE_TTL_SECONDS, payload)
+
+
+def invalidate_metrics_cache():
+    """Drop every cached metrics/leaderboard response"""
+    with _cache_lock:
+        _cache.clear()
+
+
+def _cached_response(payload):
+    return conditional_json(payload, max_age=CACHE_TTL_SECONDS)
+
+
 def _normalize_user_id(user_id):
     """
     Supports both:
@@ -34,7 +87,12 @@ def get_retailer_metrics(user_id):
     try:
         lookup_id = _normalize_user_id(user_id)
 
-        user = User.objects(id=lookup_id).first()
+        cache_key = ('retailer', lookup_id)
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            return _cached_response(cached)
+
+        user = User.objects(id=lookup_id).exclude('user_image').first()
         if not user:
             return jsonify({"errors": ["Retailer metrics not found"]}), 404
 
@@ -42,7 +100,8 @@ def get_retailer_metrics(user_id):
             return jsonify({"errors": ["User is not a retailer"]}), 403
 
         performance = SalesManager.get_retailer_performance(lookup_id)
-        return jsonify(performance), 200
+        _cache_set(cache_key, performance)
+        return _cached_response(performance)
 
     except Exception as e:
         return jsonify({"errors": [f"Failed to get metrics: {str(e)}"]}), 500
@@ -58,12 +117,19 @@ def get_leaderboard():
     """Get top performing retailers"""
     try:
         limit = request.args.get('limit', 10, type=int)
-        leaderboard = SalesManager.get_leaderboard(limit=limit)
+        limit = max(1, min(limit, LEADERBOARD_MAX_LIMIT))
 
-        return jsonify({
-            'leaderboard': leaderboard,
-            'total_retailers': len(leaderboard)
-        }), 200
+        cache_key = ('leaderboard', limit)
+        payload = _cache_get(cache_key)
+        if payload is None:
+            leaderboard = SalesManager.get_leaderboard(limit=limit)
+            payload = {
+                'leaderboard': leaderboard,
+                'total_retailers': len(leaderboard)
+            }
+            _cache_set(cache_key, payload)
+
+        return _cached_response(payload)
 
     except Exception as e:
         return jsonify({"errors": [f"Failed to get leaderboard: {str(e)}"]}), 500
@@ -100,6 +166,7 @@ def update_retailer_quota(user_id):
         lookup_id = _normalize_user_id(user_id)
 
         metrics = SalesManager.update_retailer_quota(lookup_id, daily_quota)
+        invalidate_metrics_cache()
 
         updated_by = data.get('updated_by')
         ActivityLogger.log_api_activity(
@@ -136,6 +203,7 @@ def reset_retailer_streak():
 
     try:
         updated_count = SalesManager.reset_daily_metrics()
+        invalidate_metrics_cache()
 
         ActivityLogger.log_api_activity(
             method='POST',
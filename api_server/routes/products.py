@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 from flask import Blueprint, request, jsonify, send_file
 from flask import Blueprint, request, jsonify
 from mongoengine import Q
-from mongoengine.errors import DoesNotExist
+from mongoengine.errors import BulkWriteError, DoesNotExist, NotUniqueError, ValidationError
 
 from models.product import Product
 from models.category import Category
@@ -17,7 +17,11 @@ from models.user import User
 from core.inventory_manager import InventoryManager, InventoryError
 from core.activity_logger import ActivityLogger
 
-from utils import get_image_binary, extract_int, parse_date
+from utils import (
+    get_image_binary, extract_int, parse_date, category_exists,
+    get_request_data, coerce_ints, conditional_json
+)
+from utils.counters import reserve_sequence_block
 
 bp = Blueprint('products', __name__)
 
@@ -33,7 +37,7 @@ def _get_actor_id(data: dict | None) -> int:
 
 
 def _get_actor_user(actor_id: int):
-    return User.objects(id=actor_id).first()
+    return User.objects(id=actor_id).exclude('user_image').first()
 
 
 def _err(msg: str, code: int = 400):
@@ -81,7 +85,8 @@ def list_product():
     filters = []
 
     if name := args.get('name'):
-        filters.append(Q(name__icontains=name))
+        # matched against the indexed lowercase copy instead of a case-insensitive regex on name
+        filters.append(Q(name_lower__contains=name.lower()))
 
     if brand := args.get('brand'):
         filters.append(Q(brand__icontains=brand))
@@ -108,15 +113,25 @@ def list_product():
 
     total = query.count()
     skip = (page - 1) * per_page
-    products = query.skip(skip).limit(per_page)
     pages = (total + per_page - 1) // per_page
 
-    return jsonify({
+    if include_image:
+        products = query.skip(skip).limit(per_page)
+        product_dicts = [p.to_dict(include_image=True) for p in products]
+    else:
+        # Leave the image blobs in the database; only report which have one
+        products = list(query.exclude('product_image').skip(skip).limit(per_page))
+        with_image = set(
+            Product.objects(id__in=[p.id for p in products], product_image__ne=None).distinct('id')
+        )
+        product_dicts = [p.to_dict(has_image=p.id in with_image) for p in products]
+
+    return conditional_json({
         "page": page,
         "per_page": per_page,
         "total": total,
         "pages": pages,
-        "products": [p.to_dict(include_image=include_image) for p in products]
+        "products": product_dicts
     })
 
 
@@ -132,7 +147,7 @@ def get_product(id):
     if not product:
         return _err("Product not found", 404)
 
-    return jsonify(product.to_dict(include_image, include_batches))
+    return conditional_json(product.to_dict(include_image, include_batches))
 
 
 # ----------------------------------------------------------------------
@@ -166,11 +181,11 @@ def get_product_image(id: int):
 # ----------------------------------------------------------------------
 @bp.route('/<int:product_id>/stock_batches', methods=['GET'])
 def list_stock_batches(product_id):
-    product = Product.objects(id=product_id).first()
+    product = Product.objects(id=product_id).exclude('product_image').first()
     if not product:
         return _err("Product not found", 404)
 
-    category = Category.objects(id=product.category_id).first() if product.category_id else None
+    category = Category.objects(id=product.category_id).only('name').first() if product.category_id else None
     batches = [batch.to_dict() for batch in StockBatch.objects(product_id=product.id)]
 
     return jsonify({
@@ -187,40 +202,38 @@ def list_stock_batches(product_id):
 # ----------------------------------------------------------------------
 @bp.route('', methods=['POST'])
 def create_product():
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
     if not data.get('name'):
         return _err("Product name is required", 400)
 
-    price = extract_int(data.get('price'))
+    ints = coerce_ints(data)
+
+    price = ints['price']
     if price is None:
         return _err("Price must be a number", 400)
 
     # Category handling:
     # If your Product model still requires category_id,
     # this route will enforce it cleanly here.
-    category_id = None
-    if 'category_id' in data and data.get('category_id') not in (None, "", "null"):
-        category_id = extract_int(data.get('category_id'))
+    category_id = ints['category_id']
 
     if category_id:
-        if not Category.objects(id=category_id).first():
+        if not category_exists(category_id):
             return _err("Invalid category ID", 400)
 
-    if category_id is None:
     # If category_id is still required in your Product model,
     # enforce here to avoid 500
     if category_id is None:
         # Only enforce if categories exist in the system:
         # This keeps your UI flexible in early dev/testing.
-        has_any_category = Category.objects().first() is not None
+        has_any_category = Category.objects.only('id').first() is not None
         product_category_required = True  # change to False if you want fully optional
         if has_any_category and product_category_required:
             return _err("Category is required", 400)
 
     image_blob = get_image_binary()
-    min_stock = extract_int(data.get('min_stock_level'), 10)
+    min_stock = ints['min_stock_level'] if ints['min_stock_level'] is not None else 10
 
     product = Product(
         name=data['name'],
@@ -234,7 +247,7 @@ def create_product():
 
     product.save()
 
-    initial_stock = extract_int(data.get('stock_level'), 0) or 0
+    initial_stock = ints['stock_level'] or 0
     include_batches = False
 
     actor_id = _get_actor_id(data)
@@ -270,12 +283,139 @@ def create_product():
     return jsonify(product.to_dict(include_image=True, include_batches=include_batches)), 201
 
 
+# ----------------------------------------------------------------------
+# POST /api/v1/products/bulk → create many products in one request
+# ----------------------------------------------------------------------
+@bp.route('/bulk', methods=['POST'])
+def bulk_create_products():
+    data = get_request_data()
+
+    items = data.get('products')
+    if not isinstance(items, list) or not items:
+        return _err("products must be a non-empty list", 400)
+
+    rows = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get('name'):
+            return _err(f"products[{index}]: Product name is required", 400)
+        ints = coerce_ints(item)
+        if ints['price'] is None:
+            return _err(f"products[{index}]: Price must be a number", 400)
+        rows.append((item, ints))
+
+    # names are unique (case-sensitive index): reject repeats within the batch
+    # and names already taken, before any ids are reserved or rows written
+    seen = set()
+    for index, (item, _) in enumerate(rows):
+        if item['name'] in seen:
+            return _err(f"products[{index}]: Duplicate product name in batch", 400)
+        seen.add(item['name'])
+    taken = set(Product.objects(name__in=list(seen)).distinct('name'))
+    for index, (item, _) in enumerate(rows):
+        if item['name'] in taken:
+            return _err(f"products[{index}]: Product name already exists", 400)
+
+    # one query for every category the batch references
+    wanted = {ints['category_id'] for _, ints in rows if ints['category_id']}
+    known = set(Category.objects(id__in=list(wanted)).distinct('id')) if wanted else set()
+    category_required = (
+        any(not ints['category_id'] for _, ints in rows)
+        and Category.objects.only('id').first() is not None
+    )
+
+    for index, (_, ints) in enumerate(rows):
+        category_id = ints['category_id']
+        if category_id and category_id not in known:
+            return _err(f"products[{index}]: Invalid category ID", 400)
+        if not category_id and category_required:
+            return _err(f"products[{index}]: Category is required", 400)
+
+    first_id = reserve_sequence_block(Product.__name__.lower(), len(rows))
+    products = []
+    try:
+        for offset, (item, ints) in enumerate(rows):
+            product = Product(
+                id=first_id + offset,
+                name=item['name'],
+                brand=item.get('brand'),
+                price=ints['price'],
+                category_id=ints['category_id'],
+                min_stock_level=ints['min_stock_level'] if ints['min_stock_level'] is not None else 10,
+                details=item.get('details')
+            )
+            product.validate()
+            products.append(product)
+    except ValidationError as e:
+        return _err(f"products[{len(products)}]: {e}", 400)
+
+    try:
+        Product.objects.insert(products, load_bulk=False)
+    except (NotUniqueError, BulkWriteError):
+        # lost a race with a concurrent create; drop whatever part of the batch landed
+        Product.objects(id__in=[product.id for product in products]).delete()
+        return _err("Product name already exists", 400)
+
+    actor_id = _get_actor_id(data)
+    actor_user = _get_actor_user(actor_id)
+    now = datetime.now(timezone.utc)
+
+    stocked = [
+        (product, ints['stock_level'], item)
+        for product, (item, ints) in zip(products, rows)
+        if (ints['stock_level'] or 0) > 0
+    ]
+    if stocked:
+        first_batch_id = reserve_sequence_block(StockBatch.__name__.lower(), len(stocked))
+        StockBatch.objects.insert([
+            StockBatch(
+                id=first_batch_id + offset,
+                product_id=product.id,
+                quantity=qty,
+                expiration_date=parse_date(item.get('expiration_date')),
+                added_at=now,
+                added_by=actor_user,
+                reason="Initial stock"
+            )
+            for offset, (product, qty, item) in enumerate(stocked)
+        ], load_bulk=False)
+
+    initial = {product.id: qty for product, qty, _ in stocked}
+
+    ActivityLogger.log_api_activity(
+        method='POST',
+        target_entity='product',
+        user_id=actor_id,
+        details=f"Bulk created {len(products)} products (ids {first_id}-{first_id + len(products) - 1})"
+    )
+
+    ActivityLogger.log_product_actions([
+        {
+            'product_id': product.id,
+            'action_type': 'Create',
+            'quantity': initial.get(product.id),
+            'notes': (
+                f"Product created with initial stock: {initial[product.id]}"
+                if product.id in initial else "Product created"
+            )
+        }
+        for product in products
+    ], user_id=actor_user or actor_id)
+
+    return jsonify({
+        "created": len(products),
+        "products": [
+            {"id": product.id, "name": product.name, "stock_level": initial.get(product.id, 0)}
+            for product in products
+        ]
+    }), 201
+
+
 # ----------------------------------------------------------------------
 # POST /api/v1/products/<product_id>/stock_batches → add stock batch
 # ----------------------------------------------------------------------
 @bp.route('/<int:product_id>/stock_batches', methods=['POST'])
 def add_stock_batch(product_id):
-    product = Product.objects(id=product_id).first()
+    product = Product.objects(id=product_id).exclude('product_image').first()
     if not product:
         return _err("Product not found", 404)
 
@@ -336,33 +476,33 @@ def replace_product(product_id):
     if not product:
         return _err("Product not found", 404)
 
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
     if 'name' not in data or not data.get("name"):
         return _err("Product name is required for PUT", 400)
 
-    price = extract_int(data.get('price'))
+    ints = coerce_ints(data)
+
+    price = ints['price']
     if price is None:
         return _err("Price must be a number", 400)
 
-    category_id = None
-    if 'category_id' in data and data.get('category_id') not in (None, "", "null"):
-        category_id = extract_int(data.get('category_id'))
-        if category_id and not Category.objects(id=category_id).first():
-            return _err("Invalid category ID", 400)
+    category_id = ints['category_id']
+    if category_id and not category_exists(category_id):
+        return _err("Invalid category ID", 400)
 
     product.name = data['name']
     product.brand = data.get('brand')
     product.price = price
     product.category_id = category_id
-    product.min_stock_level = extract_int(data.get('min_stock_level'), product.min_stock_level)
+    if ints['min_stock_level'] is not None:
+        product.min_stock_level = ints['min_stock_level']
     product.details = data.get('details', product.details)
 
     # Replace ALL existing batches
     StockBatch.objects(product_id=product.id).delete()
 
-    new_stock = extract_int(data.get('stock_level'))
+    new_stock = ints['stock_level']
     actor_id = _get_actor_id(data)
     actor_user = _get_actor_user(actor_id)
 
@@ -410,34 +550,31 @@ def patch_product(product_id):
     if not product:
         return _err("Product not found", 404)
 
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
     if 'name' in data and not data['name']:
         return _err("Product name cannot be empty", 400)
 
+    ints = coerce_ints(data)
+
     if 'price' in data:
-        price = extract_int(data['price'])
+        price = ints['price']
         if price is None:
             return _err("Price must be a number", 400)
         product.price = price
 
     if 'category_id' in data:
-        cat_val = data.get('category_id')
-        if cat_val in (None, "", "null"):
-            product.category_id = None
-        else:
-            cat_id = extract_int(cat_val)
-            if cat_id and not Category.objects(id=cat_id).first():
-                return _err("Invalid category ID", 400)
-            product.category_id = cat_id
+        cat_id = ints['category_id']
+        if cat_id and not category_exists(cat_id):
+            return _err("Invalid category ID", 400)
+        product.category_id = cat_id
 
     if 'name' in data:
         product.name = data['name']
     if 'brand' in data:
         product.brand = data['brand']
-    if 'min_stock_level' in data:
-        product.min_stock_level = extract_int(data['min_stock_level'], product.min_stock_level)
+    if ints['min_stock_level'] is not None:
+        product.min_stock_level = ints['min_stock_level']
     if 'details' in data:
         product.details = data['details']
 
@@ -445,8 +582,8 @@ def patch_product(product_id):
     actor_user = _get_actor_user(actor_id)
 
     # Optional: add a new batch via PATCH
+    qty = ints['stock_level']
     if 'stock_level' in data:
-        qty = extract_int(data.get('stock_level'))
         if qty is not None:
             if qty <= 0:
                 return _err("stock_level must be a positive integer", 400)
@@ -485,7 +622,7 @@ def patch_product(product_id):
         product_id=product.id,
         user_id=actor_id,
         action_type='Edit',
-        quantity=extract_int(data.get('stock_level')) if 'stock_level' in data else None,
+        quantity=qty if 'stock_level' in data else None,
         notes=f"Updated fields: {', '.join(changed_fields)}" if changed_fields else "Updated product"
     )
 
@@ -497,7 +634,7 @@ def patch_product(product_id):
 # ----------------------------------------------------------------------
 @bp.route('/<int:product_id>/stock_batches/<int:batch_id>', methods=['PATCH'])
 def remove_stock_batch(product_id, batch_id):
-    product = Product.objects(id=product_id).first()
+    product = Product.objects(id=product_id).exclude('product_image').first()
     if not product:
         return _err("Product not found", 404)
 
@@ -568,7 +705,7 @@ def update_stock_batch_metadata(product_id, batch_id):
         # allow overwrite of metadata owner
         user_id = extract_int(data.get('added_by'))
         if user_id:
-            batch.added_by = User.objects(id=user_id).first()
+            batch.added_by = User.objects(id=user_id).exclude('user_image').first()
 
     if "reason" in data:
         batch.reason = data.get('reason') or batch.reason
@@ -602,7 +739,7 @@ def delete_product(id):
     data = request.get_json(silent=True) or {}
     actor_id = _get_actor_id(data)
 
-    product = Product.objects(id=id).first()
+    product = Product.objects(id=id).exclude('product_image').first()
     if not product:
         return _err("Product not found", 404)
 
@@ -634,7 +771,7 @@ def delete_product(id):
 # ----------------------------------------------------------------------
 @bp.route('/<int:product_id>/stock_batches/<int:batch_id>', methods=['DELETE'])
 def delete_stock_batch(product_id, batch_id):
-    product = Product.objects(id=product_id).first()
+    product = Product.objects(id=product_id).exclude('product_image').first()
     if not product:
         return _err("Product not found", 404)
 
@@ -1,13 +1,12 @@
 # api_server/routes/reports.py
 
-from flask import Blueprint, request, jsonify, send_file
+import hashlib
+import json
+
+from flask import Blueprint, request, jsonify, send_file, Response
 from core.report_generator import ReportGenerator
-from core.pdf_report_generator import PDFReportGenerator
 from datetime import datetime
 
-# Initialize PDF generator
-pdf_generator = PDFReportGenerator()
-
 bp = Blueprint('reports', __name__)
 
 
@@ -28,6 +27,38 @@ def _parse_date_param(value: str | None, label: str):
         raise ValueError(f"Invalid {label} format. Use YYYY-MM-DD")
 
 
+def _get_pdf_generator():
+    # Imported here so ReportLab is only loaded once a PDF is requested
+    from core.pdf_report_generator import get_generator
+    return get_generator()
+
+
+def _send_pdf(report_data, render_method: str, filename: str):
+    """
+    Send the PDF for report_data, tagged with an ETag taken over the
+    report data itself. A client re-requesting an unchanged report gets
+    a 304 before any PDF is rendered.
+    """
+    etag = hashlib.blake2b(
+        json.dumps(report_data, sort_keys=True, default=str).encode('utf-8'),
+        digest_size=16
+    ).hexdigest()
+
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    else:
+        pdf_buffer = getattr(_get_pdf_generator(), render_method)(report_data)
+        resp = send_file(
+            pdf_buffer,
+            mimetype='application/pdf',
+            as_attachment=True,
+            download_name=filename
+        )
+    resp.set_etag(etag)
+    resp.headers['Cache-Control'] = 'private, no-cache'
+    return resp
+
+
 def _get_date_range_from_args():
     start = request.args.get('start_date')
     end = request.args.get('end_date')
@@ -161,15 +192,8 @@ def download_sales_performance_pdf():
         start_date, end_date = _get_date_range_from_args()
         report_data = ReportGenerator.sales_performance_report(start_date, end_date)
 
-        pdf_buffer = pdf_generator.generate_sales_performance_report(report_data)
         filename = f"Sales_Performance_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
-
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(report_data, 'generate_sales_performance_report', filename)
 
     except ValueError as e:
         return jsonify({"errors": [str(e)]}), 400
@@ -185,15 +209,8 @@ def download_category_distribution_pdf():
     """Download Category Distribution Report as PDF"""
     try:
         report_data = ReportGenerator.category_distribution_report()
-        pdf_buffer = pdf_generator.generate_category_distribution_report(report_data)
-
         filename = f"Category_Distribution_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(report_data, 'generate_category_distribution_report', filename)
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate PDF: {str(e)}"]}), 500
 
@@ -206,15 +223,8 @@ def download_retailer_performance_pdf():
     """Download Retailer Performance Report as PDF"""
     try:
         report_data = ReportGenerator.retailer_performance_report()
-        pdf_buffer = pdf_generator.generate_retailer_performance_report(report_data)
-
         filename = f"Retailer_Performance_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(report_data, 'generate_retailer_performance_report', filename)
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate PDF: {str(e)}"]}), 500
 
@@ -228,15 +238,8 @@ def download_alerts_pdf():
     try:
         days_ahead = request.args.get('days_ahead', 7, type=int)
         report_data = ReportGenerator.low_stock_and_expiration_alert_report(days_ahead)
-        pdf_buffer = pdf_generator.generate_alerts_report(report_data)
-
         filename = f"Alerts_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(report_data, 'generate_alerts_report', filename)
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate PDF: {str(e)}"]}), 500
 
@@ -250,15 +253,8 @@ def download_managerial_activity_pdf():
     try:
         start_date, end_date = _get_date_range_from_args()
         report_data = ReportGenerator.managerial_activity_log_report(start_date, end_date)
-        pdf_buffer = pdf_generator.generate_managerial_activity_report(report_data)
-
         filename = f"Managerial_Activity_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(report_data, 'generate_managerial_activity_report', filename)
     except ValueError as e:
         return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
@@ -274,15 +270,8 @@ def download_transactions_pdf():
     try:
         start_date, end_date = _get_date_range_from_args()
         report_data = ReportGenerator.detailed_sales_transaction_report(start_date, end_date)
-        pdf_buffer = pdf_generator.generate_transactions_report(report_data)
-
         filename = f"Sales_Transactions_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(report_data, 'generate_transactions_report', filename)
     except ValueError as e:
         return jsonify({"errors": [str(e)]}), 400
     except Exception as e:
@@ -297,14 +286,7 @@ def download_user_accounts_pdf():
     """Download User Accounts Report as PDF"""
     try:
         report_data = ReportGenerator.user_accounts_report()
-        pdf_buffer = pdf_generator.generate_user_accounts_report(report_data)
-
         filename = f"User_Accounts_Report_{datetime.now().strftime('%Y%m%d')}.pdf"
-        return send_file(
-            pdf_buffer,
-            mimetype='application/pdf',
-            as_attachment=True,
-            download_name=filename
-        )
+        return _send_pdf(report_data, 'generate_user_accounts_report', filename)
     except Exception as e:
         return jsonify({"errors": [f"Failed to generate PDF: {str(e)}"]}), 500
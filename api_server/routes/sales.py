@@ -5,6 +5,7 @@ from datetime import datetime
 
 from core.sales_manager import SalesManager, SalesError
 from core.inventory_manager import InventoryError
+from routes.metrics import invalidate_metrics_cache
 
 bp = Blueprint("sales", __name__)
 
@@ -64,6 +65,7 @@ def record_sale():
         # - retailer metrics update
         # - logging (product + api activity)
         sale = SalesManager.record_atomic_sale(retailer_id, items, total_amount)
+        invalidate_metrics_cache()
 
         return jsonify({
             "message": "Sale recorded successfully",
@@ -103,6 +105,7 @@ def undo_sale(sale_id):
 
     try:
         SalesManager.undo_sale(sale_id, user_id)
+        invalidate_metrics_cache()
         return jsonify({
             "message": f"Sale {sale_id} undone successfully, stock restored"
         }), 200
@@ -128,6 +131,7 @@ def return_sale_item(sale_id: int, item_index: int):
 
     try:
         result = SalesManager.return_sale_item(sale_id, item_index, int(user_id))
+        invalidate_metrics_cache()
         return jsonify({
             "message": "Item returned successfully",
             "result": result
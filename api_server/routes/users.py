@@ -1,11 +1,13 @@
 # api_server/routes/users.py
 
-from flask import Blueprint, request, jsonify
+import io
+
+from flask import Blueprint, request, jsonify, send_file
 from models.user import User
 from core.user_manager import UserManager, UserError
 from core.mfa_service import MFAService
 from core.activity_logger import ActivityLogger
-from utils import get_image_binary
+from utils import get_image_binary, detect_image_mimetype, get_request_data
 
 bp = Blueprint('users', __name__)
 
@@ -38,8 +40,35 @@ def get_user(user_id):
     if not user:
         return jsonify({"errors": ["User not found"]}), 404
 
-    include_image = request.args.get('include_image') == 'true'
-    return jsonify(user.to_dict(include_image)), 200
+    if request.args.get('include_image') == 'true':
+        return jsonify(user.to_dict_with_inline_image()), 200
+    return jsonify(user.to_dict()), 200
+
+
+# ----------------------------------------------------------------------
+# GET /api/v1/users/<id>/image → fetch user image bytes
+# ----------------------------------------------------------------------
+@bp.route('/<int:user_id>/image', methods=['GET'])
+def get_user_image(user_id):
+    """Serve the user's profile picture as raw image bytes"""
+    user = User.objects(id=user_id).only('user_image').first()
+    if not user:
+        return jsonify({"errors": ["User not found"]}), 404
+
+    blob = user.user_image
+    if not blob:
+        return jsonify({"errors": ["No user image"]}), 404
+
+    mimetype, ext = detect_image_mimetype(blob)
+
+    resp = send_file(
+        io.BytesIO(blob),
+        mimetype=mimetype,
+        as_attachment=False,
+        download_name=f"user_{user_id}.{ext}"
+    )
+    resp.headers["Cache-Control"] = "public, max-age=3600"
+    return resp
 
 
 # ----------------------------------------------------------------------
@@ -48,8 +77,7 @@ def get_user(user_id):
 @bp.route('', methods=['POST'])
 def create_user():
     """Create new user account"""
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
     username = data.get('username')
     password = data.get('password')
@@ -93,8 +121,7 @@ def create_user():
 @bp.route('/<int:user_id>', methods=['PUT'])
 def replace_user(user_id):
     """Replace entire user record"""
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
     username = data.get('username')
     full_name = data.get('full_name')
@@ -130,8 +157,7 @@ def replace_user(user_id):
 @bp.route('/<int:user_id>', methods=['PATCH'])
 def update_user(user_id):
     """Partially update user"""
-    is_form = request.content_type and 'multipart/form-data' in request.content_type
-    data = request.form.to_dict() if is_form else (request.get_json() or {})
+    data = get_request_data()
 
     user_image = get_image_binary()
     if user_image is not None:
@@ -1,3 +1,9 @@
-from .helpers import parse_date, get_image_binary, extract_int
+from .helpers import (
+    parse_date, get_image_binary, extract_int, detect_image_mimetype,
+    category_exists, get_request_data, coerce_ints, conditional_json
+)
 
-__all__ = ['parse_date', 'get_image_binary', 'extract_int']
\ No newline at end of file
+__all__ = [
+    'parse_date', 'get_image_binary', 'extract_int', 'detect_image_mimetype',
+    'category_exists', 'get_request_data', 'coerce_ints', 'conditional_json'
+]
\ No newline at end of file
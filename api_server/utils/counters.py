@@ -41,3 +41,21 @@ def get_next_sequence(collection_name: str) -> int:
         return_document=ReturnDocument.AFTER
     )
     return int(updated['seq'])
+
+
+def reserve_sequence_block(collection_name: str, count: int) -> int:
+    """
+    Atomically reserve `count` consecutive IDs for a collection and
+    return the first one. Used for bulk inserts.
+    """
+    _ensure_connection()
+    db = get_db()
+
+    key = f"{collection_name}_id"
+    updated = db.counters.find_one_and_update(
+        {'_id': key},
+        {'$inc': {'seq': int(count)}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return int(updated['seq']) - int(count) + 1
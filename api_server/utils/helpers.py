@@ -1,12 +1,38 @@
-from flask import request
-from datetime import datetime
+from flask import request, g, jsonify, current_app
+from werkzeug.exceptions import RequestEntityTooLarge
+from werkzeug.http import parse_etags
+from datetime import datetime, date
 import base64
+from binascii import a2b_base64
+import imghdr
+import os
+import re
+
+# largest image accepted for a product/category/user picture
+MAX_IMAGE_BYTES = int(os.getenv('MAX_IMAGE_BYTES', 5 * 1024 * 1024))
+
+# strptime fallbacks for inputs the ISO parsers reject (e.g. unpadded dates)
+_DATE_FORMATS = ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")
+
+# Flask-Compress rewrites the ETag of a compressed response to W/"<hash>:<encoding>"
+_ETAG_ENCODING_SUFFIX = re.compile(r':(?:br|gzip|deflate|zstd)"')
+
 
 def parse_date(value):
     """Convert string to date — accepts YYYY-MM-DD or ISO format"""
     if not value:
         return None
-    for fmt in ("%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
+
+    # Fast path: the C-implemented ISO parsers cover the usual inputs
+    if isinstance(value, str):
+        try:
+            if len(value) == 10:
+                return date.fromisoformat(value)
+            return datetime.fromisoformat(value).date()
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FORMATS:
         try:
             return datetime.strptime(value, fmt).date()
         except ValueError:
@@ -18,37 +44,104 @@ def get_image_binary():
     """
     Extract image binary data from:
     - multipart/form-data → file upload (field name: 'image')
-    - JSON or form-data → binary data (field name: 'image_data')
+    - JSON or form-data → base64 data (field name: 'image_data')
     Returns bytes or None
     """
-    # 1. File upload
-    if "image" in request.files and request.files["image"].filename:
-        file = request.files["image"]
-        return file.read()
+    # Dispatch on the already-parsed mimetype so a form upload never goes
+    # through JSON parsing and a JSON body is parsed (and cached) only once
+    mimetype = request.mimetype
+
+    if mimetype == "multipart/form-data":
+        # 1. File upload
+        file = request.files.get("image")
+        if file and file.filename:
+            # read at most one byte past the cap instead of the whole upload
+            data = file.stream.read(MAX_IMAGE_BYTES + 1)
+            if len(data) > MAX_IMAGE_BYTES:
+                raise RequestEntityTooLarge(f"Image exceeds {MAX_IMAGE_BYTES} bytes")
+            return data
+        raw = request.form.get("image_data")
+    elif mimetype == "application/json":
+        # 2. Binary data from JSON
+        raw = (request.get_json(silent=True) or {}).get("image_data")
+    else:
+        raw = request.form.get("image_data")
 
-    # 2. Binary data from JSON or form
-    raw = (
-        request.form.get("image_data") or
-        (request.get_json(silent=True) or {}).get("image_data")
-    )
     if raw:
         # If it's already bytes, return as-is
         if isinstance(raw, bytes):
             return raw
-        # If it's a string representation, try to decode
+        if not isinstance(raw, str):
+            return None
+        # Base64 text, optionally as a data URI ("data:image/png;base64,...")
+        if raw.startswith("data:"):
+            raw = raw.partition(",")[2]
         try:
-            return raw.encode('latin1') if isinstance(raw, str) else None
-        except Exception:
+            return a2b_base64(raw)
+        except ValueError:
+            # binascii.Error (bad padding/characters) is a ValueError, as is
+            # the error for a str holding non-ASCII characters
             return None
     return None
 
 
+def detect_image_mimetype(blob):
+    """
+    Detect image type from its leading bytes
+
+    Returns:
+        tuple: (mimetype, file extension)
+    """
+    kind = imghdr.what(None, h=blob)
+    if kind in ("jpeg", "jpg"):
+        return "image/jpeg", "jpg"
+    if kind == "png":
+        return "image/png", "png"
+    if kind == "gif":
+        return "image/gif", "gif"
+    if kind == "webp":
+        return "image/webp", "webp"
+    return "application/octet-stream", "bin"
+
+
 def extract_int(value, default=None):
     """Safely convert value to int, return default on failure"""
+    if type(value) is int:
+        return value
     try:
         return int(value) if value is not None and value != "" else default
     except (TypeError, ValueError):
         return default
+
+
+# integer fields accepted by the product create/replace/patch routes
+PRODUCT_INT_FIELDS = ('price', 'category_id', 'stock_level', 'min_stock_level')
+
+
+def coerce_ints(data, fields=PRODUCT_INT_FIELDS):
+    """
+    Convert several integer fields of a payload in one pass
+
+    Args:
+        data: Request payload
+        fields: Field names to convert
+
+    Returns:
+        dict: field -> int, or None when missing, empty or not a number
+    """
+    out = {}
+    for key in fields:
+        value = data.get(key)
+        if type(value) is int:
+            out[key] = value
+        elif value is None or value == "":
+            out[key] = None
+        else:
+            try:
+                out[key] = int(value)
+            except (TypeError, ValueError):
+                out[key] = None
+    return out
     
 def sanitize_string(value, max_length=None):
     """
@@ -150,16 +243,65 @@ def truncate_text(text, max_length=50, suffix="..."):
     return text[:max_length - len(suffix)] + suffix
 
 
+def category_exists(cat_id):
+    """
+    Check whether a category with this ID exists without loading
+    the document (or its image)
+
+    Returns:
+        bool: True if the category exists
+    """
+    # imported here: models import utils for id counters
+    from models.category import Category
+    return Category.objects(id=cat_id).only('id').first() is not None
+
+
+def conditional_json(payload, max_age=10):
+    """
+    Build a JSON response carrying an ETag, answering 304 Not Modified
+    when the client's If-None-Match already matches
+
+    Args:
+        payload: JSON-serializable body
+        max_age: Seconds the client may reuse the response without asking
+
+    Returns:
+        Response: 200 with the body, or an empty 304
+    """
+    resp = jsonify(payload)
+    resp.add_etag(weak=True)
+    cache_control = f'private, max-age={max_age}'
+    resp.headers['Cache-Control'] = cache_control
+
+    # compare against the tag as computed here, before compression suffixed it
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match:
+        etag, _ = resp.get_etag()
+        if parse_etags(_ETAG_ENCODING_SUFFIX.sub('"', if_none_match)).contains_weak(etag):
+            not_modified = current_app.response_class(status=304)
+            not_modified.set_etag(etag, weak=True)
+            not_modified.headers['Cache-Control'] = cache_control
+            return not_modified
+
+    return resp
+
+
 def get_request_data():
     """
-    Get request data from JSON or form data
+    Get request data from JSON or form data.
+    Parsed once per request and cached on flask.g.
     
     Returns:
         dict: Request data
     """
-    if request.content_type and 'multipart/form-data' in request.content_type:
-        return request.form.to_dict()
-    return request.get_json(silent=True) or {}
+    data = getattr(g, '_request_data', None)
+    if data is None:
+        if request.mimetype == 'multipart/form-data':
+            data = request.form.to_dict()
+        else:
+            data = request.get_json(silent=True) or {}
+        g._request_data = data
+    return data
 
 
 def build_mongo_filter(filters_dict):
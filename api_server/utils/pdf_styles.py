@@ -3,10 +3,12 @@ Professional PDF Report Styling Utilities for StockaDoodle IMS
 Corporate luxury design with navy blue, purple, and gold accents
 """
 
+from functools import lru_cache
+
 from reportlab.lib import colors
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT, TA_JUSTIFY
-from reportlab.platypus import PageBreak, Spacer
+from reportlab.platypus import PageBreak, Spacer, TableStyle
 from reportlab.lib.units import inch
 
 
@@ -34,10 +36,67 @@ class PDFColors:
     BORDER_COLOR = colors.HexColor('#CBD5E1')  # Lighter border
 
 
+# Table style commands, with colours resolved once at import time
+_STANDARD_TABLE_CMDS = (
+    # Header row
+    ('BACKGROUND', (0, 0), (-1, 0), PDFColors.NAVY_DARK),
+    ('TEXTCOLOR', (0, 0), (-1, 0), PDFColors.WHITE),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 11),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('TOPPADDING', (0, 0), (-1, 0), 12),
+
+    # Data rows
+    ('BACKGROUND', (0, 1), (-1, -1), PDFColors.WHITE),
+    ('TEXTCOLOR', (0, 1), (-1, -1), PDFColors.DARK_GRAY),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+    ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+
+    # Alternating row colors
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [PDFColors.WHITE, PDFColors.LIGHT_GRAY]),
+
+    # Grid lines
+    ('GRID', (0, 0), (-1, -1), 0.5, PDFColors.BORDER_COLOR),
+    ('LINEBELOW', (0, 0), (-1, 0), 2, PDFColors.GOLD_ACCENT),
+)
+
+_SUMMARY_TABLE_CMDS = (
+    ('BACKGROUND', (0, 0), (-1, -1), PDFColors.WHITE),
+    ('TEXTCOLOR', (0, 0), (-1, -1), PDFColors.DARK_GRAY),
+    ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+    ('FONTNAME', (1, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (0, -1), 11),
+    ('FONTSIZE', (1, 0), (-1, -1), 12),
+    ('ALIGN', (0, 0), (0, -1), 'LEFT'),
+    ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('TOPPADDING', (0, 0), (-1, -1), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ('GRID', (0, 0), (-1, -1), 1, PDFColors.BORDER_COLOR),
+    ('LINEBELOW', (0, 0), (-1, 0), 2, PDFColors.GOLD_ACCENT),
+)
+
+_STANDARD_TABLE_STYLE = TableStyle(_STANDARD_TABLE_CMDS)
+_SUMMARY_TABLE_STYLE = TableStyle(_SUMMARY_TABLE_CMDS)
+
+
 class PDFStyles:
-    """Reusable paragraph styles"""
+    """
+    Reusable paragraph styles.
+    Each getter builds its style once and then returns the cached
+    instance; styles are never modified after creation.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_title_style():
         """Main report title - large, centered, navy with better spacing"""
         return ParagraphStyle(
@@ -52,6 +111,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_subtitle_style():
         """Report subtitle - medium, centered, purple with better styling"""
         return ParagraphStyle(
@@ -66,6 +126,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_section_header_style():
         """Section headers - bold, left-aligned with orange background"""
         return ParagraphStyle(
@@ -82,6 +143,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_body_style():
         """Normal body text"""
         return ParagraphStyle(
@@ -95,6 +157,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_footer_style():
         """Footer text - small, centered, gray"""
         return ParagraphStyle(
@@ -107,6 +170,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_metric_label_style():
         """Metric labels in summary boxes"""
         return ParagraphStyle(
@@ -118,6 +182,7 @@ class PDFStyles:
         )
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_metric_value_style():
         """Metric values in summary boxes"""
         return ParagraphStyle(
@@ -130,64 +195,21 @@ class PDFStyles:
 
 
 class PDFTableStyles:
-    """Reusable table styling configurations"""
+    """
+    Reusable table styling configurations.
+    The TableStyles are built once at import; Table.setStyle copies the
+    commands, so one TableStyle can be applied to any number of tables.
+    """
     
     @staticmethod
     def get_standard_table_style():
         """Standard data table style with alternating rows"""
-        from reportlab.platypus import TableStyle
-        
-        return TableStyle([
-            # Header row
-            ('BACKGROUND', (0, 0), (-1, 0), PDFColors.HEADER_BG),
-            ('TEXTCOLOR', (0, 0), (-1, 0), PDFColors.WHITE),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 11),
-            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-            ('VALIGN', (0, 0), (-1, 0), 'MIDDLE'),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('TOPPADDING', (0, 0), (-1, 0), 12),
-            
-            # Data rows
-            ('BACKGROUND', (0, 1), (-1, -1), PDFColors.WHITE),
-            ('TEXTCOLOR', (0, 1), (-1, -1), PDFColors.DARK_GRAY),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-            ('VALIGN', (0, 1), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 1), (-1, -1), 8),
-            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-            
-            # Alternating row colors
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [PDFColors.WHITE, PDFColors.ROW_ALT_BG]),
-            
-            # Grid lines
-            ('GRID', (0, 0), (-1, -1), 0.5, PDFColors.BORDER_COLOR),
-            ('LINEBELOW', (0, 0), (-1, 0), 2, PDFColors.GOLD_ACCENT),
-        ])
-    
+        return _STANDARD_TABLE_STYLE
+
     @staticmethod
     def get_summary_table_style():
         """Summary metrics table style - cleaner design"""
-        from reportlab.platypus import TableStyle
-        
-        return TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), PDFColors.WHITE),
-            ('TEXTCOLOR', (0, 0), (-1, -1), PDFColors.DARK_GRAY),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (0, -1), 11),
-            ('FONTSIZE', (1, 0), (-1, -1), 12),
-            ('ALIGN', (0, 0), (0, -1), 'LEFT'),
-            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ('TOPPADDING', (0, 0), (-1, -1), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('LEFTPADDING', (0, 0), (-1, -1), 12),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-            ('GRID', (0, 0), (-1, -1), 1, PDFColors.BORDER_COLOR),
-            ('LINEBELOW', (0, 0), (-1, 0), 2, PDFColors.GOLD_ACCENT),
-        ])
+        return _SUMMARY_TABLE_STYLE
 
 
 class PDFLayoutHelpers:
@@ -2,15 +2,131 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import mmap
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, List, Any, Union
 
+# SIMD base64 when available; the stdlib encoder produces the same output
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
+# incremental JSON parsing for iter_products(); optional
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 from desktop_app.utils.config import AppConfig
 
 
 class StockaDoodleAPIError(Exception):
     """Generic API error for the desktop client."""
-    pass
+
+    def __init__(self, message: str = "", status_code: Optional[int] = None):
+        super().__init__(message)
+        # HTTP status when the server answered; None for connection/client-side errors
+        self.status_code = status_code
+
+
+# multiple of 3, so each chunk encodes to base64 without padding
+_IMAGE_CHUNK_SIZE = 57 * 1024
+
+# files at least this large are mapped and encoded in one pass instead
+_IMAGE_MMAP_THRESHOLD = 256 * 1024
+
+
+def _encode_image(image: Any) -> Any:
+    """
+    Prepare an image for the server's `image_data` field.
+
+    bytes are base64-encoded; a path (os.PathLike) is read and encoded
+    chunk by chunk, or memory-mapped when large; str (already base64)
+    and None pass through unchanged.
+    """
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        return b64encode(image).decode("ascii")
+
+    if isinstance(image, os.PathLike):
+        with open(image, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= _IMAGE_MMAP_THRESHOLD:
+                # the encoder reads the page cache directly, no copy into Python bytes
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return b64encode(mm).decode("ascii")
+
+            # sized for the exact encoded length up front, so it never regrows
+            out = bytearray(4 * ((size + 2) // 3))
+            pos = 0
+            while chunk := f.read(_IMAGE_CHUNK_SIZE):
+                encoded = b64encode(chunk)
+                out[pos:pos + len(encoded)] = encoded
+                pos += len(encoded)
+        # decode in place; slicing a full buffer would copy it first
+        if pos == len(out):
+            return out.decode("ascii")
+        return str(memoryview(out)[:pos], "ascii")
+
+    return image
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout to every request it sends."""
+
+    def __init__(self, *args, timeout: float, **kwargs):
+        self._timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        # Session.request always forwards timeout, as None when not given
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout
+        return super().send(request, **kwargs)
+
+
+class _TokenBucket:
+    """Token bucket: `capacity` attempts at once, refilled at `refill_rate` per second."""
+
+    def __init__(self, capacity: int, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+
+    def try_consume(self, amount: int = 1) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+        if self.tokens < amount:
+            return False
+        self.tokens -= amount
+        return True
+
+    def wait_time(self, amount: int = 1) -> float:
+        """Seconds until `amount` tokens are available (valid right after try_consume)."""
+        return max(0.0, (amount - self.tokens) / self.refill_rate)
+
+
+def _clean(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drop None values from a request body. An all-None body becomes {},
+    which is still sent: several routes call request.get_json() and
+    would reject a request with no JSON body at all.
+    """
+    return {k: v for k, v in data.items() if v is not None}
 
 
 class StockaDoodleAPI:
@@ -21,40 +137,202 @@ class StockaDoodleAPI:
     Notes:
     - _request() supports JSON by default.
     - For PDF or other binary responses, use raw=True or call download_pdf_report().
+    - All calls share one pooled, keep-alive Session.
+    - Any get_* method has a get_*_async twin returning a Future, so a
+      screen can start several lookups at once without blocking the UI.
     """
 
+    # connections kept open to the API host (UI screens fire several calls at once)
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+
+    # transient failures (server restarting, proxy hiccups) are retried with backoff;
+    # POST and PATCH are left out because they may add stock or record sales twice,
+    # DELETE because sale item returns are addressed by list index and undo_sale
+    # replays come back as errors
+    RETRY = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD", "PUT"]),
+        raise_on_status=False
+    )
+
+    # seconds a GET response may be reused, by endpoint prefix;
+    # any successful POST/PUT/PATCH/DELETE drops every cached response
+    CACHE_TTLS = {
+        "dashboard/": 5,
+        "retailer/leaderboard": 15,
+        "reports/category-distribution": 30,
+        "categories": 60,
+    }
+
+    # MFA verification attempts allowed per user before waiting; one more every 60 s
+    MFA_ATTEMPTS = 5
+    MFA_REFILL_SECONDS = 60
+
+    # (connect, read) seconds for MFA verification, which the login flow waits on;
+    # at most one retry, so a dead server is reported in about 5 s
+    MFA_VERIFY_TIMEOUT = (2, 5)
+    MFA_VERIFY_RETRY_DELAY = 0.25
+
+    # PDFs kept for revalidation; each distinct report/date range is one entry
+    PDF_CACHE_SIZE = 4
+
     def __init__(
         self,
         base_url: str | None = None,
         timeout: int | None = None
     ):
         self.base_url = base_url or AppConfig.API_BASE_URL
+        # joined once; every request URL is this plus the endpoint path
+        self._prefix = self.base_url.rstrip("/") + "/"
         self.timeout = timeout or AppConfig.API_TIMEOUT
 
         self.session = requests.Session()
+        self.session.headers.update({
+            "Accept": "application/json",
+            # gzip/deflate, plus br when a brotli decoder is installed
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+        })
+        adapter = _TimeoutAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=self.RETRY,
+            timeout=self.timeout
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # MFA verify gets no adapter-level retries (the longest mounted prefix
+        # wins), so verify_mfa_code's single manual retry is the only one
+        self.session.mount(
+            self._prefix + "users/auth/mfa/verify",
+            _TimeoutAdapter(pool_connections=1, pool_maxsize=1, max_retries=0,
+                            timeout=self.MFA_VERIFY_TIMEOUT)
+        )
+
         self.current_user: Optional[Dict[str, Any]] = None
 
+        self._cache: Dict[tuple, tuple] = {}  # key -> (expires_at, data)
+        self._cache_lock = threading.Lock()
+
+        # last PDF per report/params, revalidated with If-None-Match
+        # key -> (etag, last_modified, bytes), least recently used first
+        self._pdf_cache: OrderedDict = OrderedDict()
+        self._pdf_cache_lock = threading.Lock()
+
+        # worker threads for *_async calls, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # per-username MFA attempt budget, checked before calling the server
+        self._mfa_buckets: Dict[str, _TokenBucket] = {}
+
+    def __getattr__(self, name: str):
+        # get_products_async(...) -> submit(get_products, ...)
+        if name.startswith("get_") and name.endswith("_async"):
+            return functools.partial(self.submit, getattr(self, name[:-len("_async")]))
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    # ----------------------------
+    # Background execution
+    # ----------------------------
+    def submit(self, func, *args, **kwargs) -> Future:
+        """Run a client method on the shared worker pool and return its Future."""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    # half the connection pool, leaving room for calls made on the UI thread
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.POOL_MAXSIZE // 2,
+                        thread_name_prefix="stockadoodle-api"
+                    )
+        return self._executor.submit(func, *args, **kwargs)
+
+    def _request_async(self, method: str, endpoint: str, **kwargs) -> Future:
+        return self.submit(self._request, method, endpoint, **kwargs)
+
+    def fetch_many(self, *calls) -> List[Any]:
+        """
+        Run several zero-argument calls (e.g. functools.partial of client
+        methods) concurrently and return their results in order, so a
+        screen waits for the slowest call instead of the sum of all.
+
+        A call that raised contributes its exception instead of a result.
+        """
+        futures = [self.submit(call) for call in calls]
+        results: List[Any] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def close(self) -> None:
+        """Stop the worker pool and close pooled connections."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self.session.close()
+
     # ----------------------------
     # Core request helpers
     # ----------------------------
+    def _cache_ttl(self, endpoint: str) -> int:
+        for prefix, ttl in self.CACHE_TTLS.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return 0
+
+    def _cache_get(self, key: tuple) -> Any:
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._cache[key]
+                return None
+            return copy.deepcopy(entry[1])
+
+    def _cache_set(self, key: tuple, ttl: int, data: Any) -> None:
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + ttl, copy.deepcopy(data))
+
+    @staticmethod
+    def _materialize_image(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Encode data["image_data"] for the wire; every create/update goes through here."""
+        if "image_data" in data:
+            data["image_data"] = _encode_image(data["image_data"])
+        return data
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached GET response."""
+        with self._cache_lock:
+            self._cache.clear()
+
     def _url(self, endpoint: str) -> str:
-        return f"{self.base_url}/{endpoint.lstrip('/')}"
+        return self._prefix + endpoint.lstrip("/")
 
     def _raise_api_error(self, response: requests.Response) -> None:
         try:
-            data = response.json()
+            data = orjson.loads(response.content)
         except Exception:
             data = None
 
         if isinstance(data, dict):
             errors = data.get("errors")
             if isinstance(errors, list) and errors:
-                raise StockaDoodleAPIError(str(errors[0]))
+                raise StockaDoodleAPIError(str(errors[0]), response.status_code)
             message = data.get("message")
             if message:
-                raise StockaDoodleAPIError(str(message))
+                raise StockaDoodleAPIError(str(message), response.status_code)
 
-        raise StockaDoodleAPIError(f"HTTP {response.status_code}: {response.reason}")
+        raise StockaDoodleAPIError(
+            f"HTTP {response.status_code}: {response.reason}", response.status_code
+        )
 
     def _request(
         self,
@@ -70,15 +348,29 @@ class StockaDoodleAPI:
             method: HTTP method
             endpoint: API endpoint
             raw: If True, returns bytes without JSON parsing.
-            **kwargs: forwarded to requests.Session.request()
+            **kwargs: forwarded to requests.Session.request();
+                a json= body is serialized here with orjson, and the
+                timeout defaults to self.timeout via the session adapter
 
         Returns:
             dict (JSON) by default, or bytes if raw=True or response is PDF.
         """
-        url = self._url(endpoint)
-
-        if "timeout" not in kwargs:
-            kwargs["timeout"] = self.timeout
+        path = endpoint.lstrip("/")
+        url = self._prefix + path
+
+        cache_key = None
+        ttl = 0
+        if method == "GET" and not raw:
+            ttl = self._cache_ttl(path)
+            if ttl:
+                cache_key = (path, tuple(sorted((kwargs.get("params") or {}).items())))
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    return cached
+
+        if kwargs.get("json") is not None:
+            kwargs["data"] = orjson.dumps(kwargs.pop("json"), option=orjson.OPT_NON_STR_KEYS)
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
 
         try:
             response = self.session.request(method, url, **kwargs)
@@ -87,35 +379,25 @@ class StockaDoodleAPI:
             is_pdf = "application/pdf" in content_type
 
             if not response.ok:
-                try:
-                    data = response.json()
-                except Exception:
-                    data = None
-
-                if isinstance(data, dict):
-                    errors = data.get("errors")
-                    if isinstance(errors, list) and errors:
-                        raise StockaDoodleAPIError(str(errors[0]))
-                    message = data.get("message")
-                    if message:
-                        raise StockaDoodleAPIError(str(message))
-
-                raise StockaDoodleAPIError(
-                    f"HTTP {response.status_code}: {response.reason}"
-                )
+                self._raise_api_error(response)
 
             if raw or is_pdf:
                 return response.content
 
             try:
-                data = response.json()
+                data = orjson.loads(response.content)
             except Exception:
                 data = None
 
-            return data or {}
+            data = data or {}
+            if cache_key is not None:
+                self._cache_set(cache_key, ttl, data)
+            elif method != "GET":
+                self.invalidate_cache()
+            return data
 
         except requests.exceptions.RequestException as e:
-            raise StockaDoodleAPIError(f"Connection error: {str(e)}")
+            raise StockaDoodleAPIError(f"Connection error: {str(e)}") from e
 
     # ================================================================
     # AUTHENTICATION & USER MANAGEMENT
@@ -135,27 +417,52 @@ class StockaDoodleAPI:
         return result  # type: ignore[return-value]
 
     def verify_mfa_code(self, username: str, code: str) -> Dict[str, Any]:
+        bucket = self._mfa_buckets.get(username)
+        if bucket is None:
+            bucket = self._mfa_buckets[username] = _TokenBucket(
+                self.MFA_ATTEMPTS, 1 / self.MFA_REFILL_SECONDS
+            )
+        if not bucket.try_consume():
+            raise StockaDoodleAPIError(
+                f"Too many attempts, wait {int(bucket.wait_time()) + 1} seconds and try again."
+            )
+
         data = {"username": username, "code": code}
-        result = self._request("POST", "/users/auth/mfa/verify", json=data)
+        try:
+            result = self._request(
+                "POST", "/users/auth/mfa/verify", json=data, timeout=self.MFA_VERIFY_TIMEOUT
+            )
+        except StockaDoodleAPIError as e:
+            # retry once only if the request never reached the server; after a
+            # read timeout the code may already be consumed
+            if not isinstance(e.__cause__, requests.exceptions.ConnectTimeout):
+                raise
+            time.sleep(self.MFA_VERIFY_RETRY_DELAY)
+            result = self._request(
+                "POST", "/users/auth/mfa/verify", json=data, timeout=self.MFA_VERIFY_TIMEOUT
+            )
         if isinstance(result, dict):
             self.current_user = result.get("user")
+            if self.current_user:
+                self._mfa_buckets.pop(username, None)
         return result  # type: ignore[return-value]
 
     def logout(self):
         self.current_user = None
+        self.invalidate_cache()
 
     # ================================================================
     # USER MANAGEMENT
     # ================================================================
     def get_users(self, role: Optional[str] = None) -> List[Dict[str, Any]]:
-        params = {"role": role} if role else {}
+        params = {"role": role} if role else None
         result = self._request("GET", "/users", params=params)
         if isinstance(result, dict):
             return result.get("users", [])
         return []
 
     def get_user(self, user_id: int, include_image: bool = False) -> Dict[str, Any]:
-        params = {"include_image": "true"} if include_image else {}
+        params = {"include_image": "true"} if include_image else None
         result = self._request("GET", f"/users/{user_id}", params=params)
         return result  # type: ignore[return-value]
 
@@ -177,11 +484,13 @@ class StockaDoodleAPI:
         }
         if user_image:
             data["image_data"] = user_image
+        data = self._materialize_image(data)
 
         result = self._request("POST", "/users", json=data)
         return result  # type: ignore[return-value]
 
     def update_user(self, user_id: int, **kwargs) -> Dict[str, Any]:
+        kwargs = self._materialize_image(kwargs)
         result = self._request("PATCH", f"/users/{user_id}", json=kwargs)
         return result  # type: ignore[return-value]
 
@@ -198,14 +507,14 @@ class StockaDoodleAPI:
     # CATEGORY MANAGEMENT
     # ================================================================
     def get_categories(self, include_image: bool = False) -> List[Dict[str, Any]]:
-        params = {"include_image": "true"} if include_image else {}
+        params = {"include_image": "true"} if include_image else None
         result = self._request("GET", "/categories", params=params)
         if isinstance(result, dict):
             return result.get("categories", [])
         return []
 
     def get_category(self, category_id: int, include_image: bool = False) -> Dict[str, Any]:
-        params = {"include_image": "true"} if include_image else {}
+        params = {"include_image": "true"} if include_image else None
         result = self._request("GET", f"/categories/{category_id}", params=params)
         return result  # type: ignore[return-value]
 
@@ -216,15 +525,17 @@ class StockaDoodleAPI:
         category_image: Optional[bytes] = None
     ) -> Dict[str, Any]:
         data: Dict[str, Any] = {"name": name, "description": description}
-        data = {k: v for k, v in data.items() if v is not None}
+        data = _clean(data)
 
         if category_image:
             data["image_data"] = category_image
+        data = self._materialize_image(data)
 
         result = self._request("POST", "/categories", json=data)
         return result  # type: ignore[return-value]
 
     def update_category(self, category_id: int, **kwargs) -> Dict[str, Any]:
+        kwargs = self._materialize_image(kwargs)
         result = self._request("PATCH", f"/categories/{category_id}", json=kwargs)
         return result  # type: ignore[return-value]
 
@@ -242,25 +553,72 @@ class StockaDoodleAPI:
         include_image: bool = False,
         **filters
     ) -> Dict[str, Any]:
-        params = {
-            "page": page,
-            "per_page": per_page,
-            "include_image": "true" if include_image else "false",
-            **filters,
-        }
+        params = self._product_params(page, per_page, include_image, filters)
         result = self._request("GET", "/products", params=params)
         return result  # type: ignore[return-value]
 
+    def iter_products(
+        self,
+        page: int = 1,
+        per_page: int = 10,
+        include_image: bool = False,
+        **filters
+    ):
+        """
+        Yield one page of products as they are parsed off the wire, so a
+        page of inline images is never held as a single JSON string.
+        Falls back to get_products() when ijson is not installed.
+        """
+        if ijson is None:
+            result = self.get_products(page, per_page, include_image, **filters)
+            yield from result.get("products", [])
+            return
+
+        params = self._product_params(page, per_page, include_image, filters)
+        try:
+            with self.session.get(
+                self._url("products"),
+                params=params,
+                stream=True
+            ) as response:
+                if not response.ok:
+                    self._raise_api_error(response)
+                # let urllib3 undo gzip/br before ijson reads the stream
+                response.raw.decode_content = True
+                yield from ijson.items(response.raw, "products.item", use_float=True)
+        except requests.exceptions.RequestException as e:
+            raise StockaDoodleAPIError(f"Connection error: {str(e)}")
+
+    @staticmethod
+    def _product_params(
+        page: int,
+        per_page: int,
+        include_image: bool,
+        filters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        # unset filters stay out of the query string; the server defaults
+        # include_image to off and only recognises the literal "true"
+        params = {k: v for k, v in filters.items() if v is not None}
+        params["page"] = page
+        params["per_page"] = per_page
+        if include_image:
+            params["include_image"] = "true"
+        return params
+
     def get_product(
         self,
         product_id: int,
         include_image: bool = False,
         include_batches: bool = False
     ) -> Dict[str, Any]:
-        params = {
-            "include_image": "true" if include_image else "false",
-            "include_batches": "true" if include_batches else "false",
-        }
+        # plain row lookups (the common case) send no query string at all
+        params = None
+        if include_image or include_batches:
+            params = {}
+            if include_image:
+                params["include_image"] = "true"
+            if include_batches:
+                params["include_batches"] = "true"
         result = self._request("GET", f"/products/{product_id}", params=params)
         return result  # type: ignore[return-value]
 
@@ -289,15 +647,17 @@ class StockaDoodleAPI:
             "added_by": added_by or (self.current_user["id"] if self.current_user else None),
         }
 
-        data = {k: v for k, v in data.items() if v is not None}
+        data = _clean(data)
 
         if product_image:
             data["image_data"] = product_image
+        data = self._materialize_image(data)
 
         result = self._request("POST", "/products", json=data)
         return result  # type: ignore[return-value]
 
     def update_product(self, product_id: int, **kwargs) -> Dict[str, Any]:
+        kwargs = self._materialize_image(kwargs)
         if self.current_user and "added_by" not in kwargs:
             kwargs["added_by"] = self.current_user["id"]
         result = self._request("PATCH", f"/products/{product_id}", json=kwargs)
@@ -305,7 +665,7 @@ class StockaDoodleAPI:
 
     def delete_product(self, product_id: int, user_id: Optional[int] = None) -> Dict[str, Any]:
         data = {"user_id": user_id or (self.current_user["id"] if self.current_user else None)}
-        result = self._request("DELETE", f"/products/{product_id}", json=data)
+        result = self._request("DELETE", f"/products/{product_id}", json=_clean(data))
         return result  # type: ignore[return-value]
 
     # ================================================================
@@ -329,7 +689,7 @@ class StockaDoodleAPI:
             "reason": reason,
             "added_by": added_by or (self.current_user["id"] if self.current_user else None),
         }
-        result = self._request("POST", f"/products/{product_id}/stock_batches", json=data)
+        result = self._request("POST", f"/products/{product_id}/stock_batches", json=_clean(data))
         return result  # type: ignore[return-value]
 
     def dispose_product(
@@ -346,7 +706,7 @@ class StockaDoodleAPI:
             "user_id": user_id or (self.current_user["id"] if self.current_user else None),
             "notes": reason,
         }
-        result = self._request("POST", "/log/dispose", json=data)
+        result = self._request("POST", "/log/dispose", json=_clean(data))
         return result  # type: ignore[return-value]
 
     def delete_stock_batch(
@@ -356,7 +716,7 @@ class StockaDoodleAPI:
         user_id: Optional[int] = None
     ) -> Dict[str, Any]:
         data = {"user_id": user_id or (self.current_user["id"] if self.current_user else None)}
-        result = self._request("DELETE", f"/products/{product_id}/stock_batches/{batch_id}", json=data)
+        result = self._request("DELETE", f"/products/{product_id}/stock_batches/{batch_id}", json=_clean(data))
         return result  # type: ignore[return-value]
 
     # ================================================================
@@ -384,18 +744,19 @@ class StockaDoodleAPI:
         return result  # type: ignore[return-value]
 
     def get_sale(self, sale_id: int, include_items: bool = True) -> Dict[str, Any]:
-        params = {"include_items": "true" if include_items else "false"}
+        # the server includes items unless told otherwise
+        params = None if include_items else {"include_items": "false"}
         result = self._request("GET", f"/sales/{sale_id}", params=params)
         return result  # type: ignore[return-value]
 
     def undo_sale(self, sale_id: int, user_id: Optional[int] = None) -> Dict[str, Any]:
         data = {"user_id": user_id or (self.current_user["id"] if self.current_user else None)}
-        result = self._request("DELETE", f"/sales/{sale_id}", json=data)
+        result = self._request("DELETE", f"/sales/{sale_id}", json=_clean(data))
         return result  # type: ignore[return-value]
 
     def return_sale_item(self, sale_id: int, item_index: int, user_id: Optional[int] = None) -> Dict[str, Any]:
         data = {"user_id": user_id or (self.current_user["id"] if self.current_user else None)}
-        result = self._request("DELETE", f"/sales/{sale_id}/items/{item_index}", json=data)
+        result = self._request("DELETE", f"/sales/{sale_id}/items/{item_index}", json=_clean(data))
         return result  # type: ignore[return-value]
 
     # ================================================================
@@ -473,7 +834,7 @@ class StockaDoodleAPI:
             "new_quota": new_quota,
             "updated_by": updated_by or (self.current_user["id"] if self.current_user else None),
         }
-        result = self._request("PATCH", f"/metrics/retailer/{user_id}/quota", json=data)
+        result = self._request("PATCH", f"/metrics/retailer/{user_id}/quota", json=_clean(data))
         return result  # type: ignore[return-value]
 
     # ================================================================
@@ -538,15 +899,53 @@ class StockaDoodleAPI:
     # REPORTS (PDF download)
     # ================================================================
     def download_pdf_report(self, report_type: str, **params) -> bytes:
-        result = self._request(
-            "GET",
-            f"/reports/{report_type}/pdf",
-            params=params or None,
-            raw=True
-        )
-        if isinstance(result, (bytes, bytearray)):
-            return bytes(result)
-        raise StockaDoodleAPIError("PDF download failed: response was not bytes.")
+        """
+        Download a report PDF. The last few copies are kept per report and
+        params; if the server answers 304 it is returned without a download.
+        """
+        key = (report_type, tuple(sorted(params.items())))
+        with self._pdf_cache_lock:
+            cached = self._pdf_cache.get(key)
+            if cached:
+                self._pdf_cache.move_to_end(key)
+
+        headers = {"Accept": "application/pdf"}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        try:
+            with self.session.get(
+                self._url(f"reports/{report_type}/pdf"),
+                params=params or None,
+                headers=headers,
+                stream=True
+            ) as response:
+                if response.status_code == 304 and cached:
+                    return cached[2]
+                if not response.ok:
+                    self._raise_api_error(response)
+
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    body += chunk
+                pdf = bytes(body)
+
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except requests.exceptions.RequestException as e:
+            raise StockaDoodleAPIError(f"Connection error: {str(e)}")
+
+        if etag or last_modified:
+            with self._pdf_cache_lock:
+                self._pdf_cache[key] = (etag, last_modified, pdf)
+                self._pdf_cache.move_to_end(key)
+                while len(self._pdf_cache) > self.PDF_CACHE_SIZE:
+                    self._pdf_cache.popitem(last=False)
+        return pdf
 
     # ================================================================
     # NOTIFICATIONS
@@ -555,7 +954,7 @@ class StockaDoodleAPI:
         result = self._request(
             "POST",
             "/notifications/low-stock",
-            json={"triggered_by": triggered_by},
+            json=_clean({"triggered_by": triggered_by}),
         )
         return result  # type: ignore[return-value]
 
@@ -565,14 +964,14 @@ class StockaDoodleAPI:
         triggered_by: Optional[int] = None
     ) -> Dict[str, Any]:
         data = {"days_ahead": days_ahead, "triggered_by": triggered_by}
-        result = self._request("POST", "/notifications/expiring", json=data)
+        result = self._request("POST", "/notifications/expiring", json=_clean(data))
         return result  # type: ignore[return-value]
 
     def send_daily_summary(self, triggered_by: Optional[int] = None) -> Dict[str, Any]:
         result = self._request(
             "POST",
             "/notifications/daily-summary",
-            json={"triggered_by": triggered_by},
+            json=_clean({"triggered_by": triggered_by}),
         )
         return result  # type: ignore[return-value]
 
@@ -16,7 +16,6 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QPixmap, QIcon
 
-from desktop_app.api_client.stockadoodle_api import StockaDoodleAPI
 from desktop_app.utils.helpers import get_feather_icon
 from desktop_app.utils.config import AppConfig  # kept for future use / consistency
 from desktop_app.utils.styles import get_dialog_style
@@ -45,7 +44,8 @@ class LoginWindow(QWidget):
                 pass
 
         # Local client (kept)
-        self.api_client = StockaDoodleAPI()
+        # the shared client, so pages reuse its session and login state
+        self.api_client = get_api()
 
         self.attempted_user: dict | None = None
 
@@ -201,8 +201,12 @@ class LoginWindow(QWidget):
 
             from desktop_app.ui.mfa_window import MFAWindow
 
-            mfa_dialog = MFAWindow(self.attempted_user, parent=self)
-            mfa_dialog.mfa_verified.connect(self.on_mfa_success)
+            mfa_dialog = MFAWindow(
+                self.attempted_user,
+                api_client=self.api_client,
+                on_verified=self.on_mfa_success,
+                parent=self
+            )
 
             # ✅ IMPORTANT: if user cancels MFA, re-enable login button
             mfa_dialog.rejected.connect(lambda: self._set_busy(False))
@@ -226,24 +230,16 @@ class LoginWindow(QWidget):
         """
         Ensure ALL parts of the desktop app can see the logged-in user:
 
-        1) local LoginWindow client
-        2) shared singleton client used by pages
-        3) AppState singleton (signals + global UI)
+        1) shared singleton client (also this window's api_client)
+        2) AppState singleton (signals + global UI)
         """
-        # 1) local client
+        # 1) shared singleton API
         try:
             self.api_client.current_user = user
         except Exception:
             pass
 
-        # 2) shared singleton API
-        try:
-            shared_api = get_api()
-            shared_api.current_user = user
-        except Exception:
-            pass
-
-        # 3) global app state
+        # 2) global app state
         try:
             set_current_user(user)
         except Exception:
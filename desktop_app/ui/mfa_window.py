@@ -1,117 +1,219 @@
 # desktop_app/ui/mfa_window.py
 import os
+from functools import lru_cache
+
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QMessageBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtCore import Qt, QTimer, QRegularExpression, pyqtSignal
+from PyQt6.QtGui import QFont, QIcon, QRegularExpressionValidator
 
-from desktop_app.api_client.stockadoodle_api import StockaDoodleAPI
+from desktop_app.api_client.stockadoodle_api import StockaDoodleAPIError
+from desktop_app.utils.api_wrapper import get_api
 from desktop_app.utils.helpers import get_feather_icon
 from desktop_app.utils.styles import get_dialog_style
 
+# resolved once at import; None when the asset is missing
+_ICON_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "assets", "icons", "stockadoodle-transparent.png"
+)
+if not os.path.isfile(_ICON_PATH):
+    _ICON_PATH = None
+
+_CENTER = Qt.AlignmentFlag.AlignCenter
+
+
+@lru_cache(maxsize=1)
+def _window_icon() -> QIcon:
+    # built on first use: a QIcon needs the QApplication to exist
+    return QIcon(_ICON_PATH)
+
 
 class MFAWindow(QDialog):
+    AUTO_SUBMIT_DELAY_MS = 150
+
+    # graphic resources shared by every dialog instance; fonts are built at
+    # import, icons on the first init_ui() (they need the QApplication)
+    _TITLE_FONT = QFont("Segoe UI", 16, QFont.Weight.Bold)
+    _CODE_FONT = QFont("Consolas", 18)
+    _CANCEL_ICON = None
+    _VERIFY_ICON = None
+
     mfa_verified = pyqtSignal(dict)
+    # (result, error) from the worker thread, delivered on the GUI thread
+    _verify_finished = pyqtSignal(object, object)
 
-    def __init__(self, user_data: dict, parent=None):
+    def __init__(self, user_data: dict, api_client=None, on_verified=None, parent=None):
         super().__init__(parent)
         self.user_data = user_data
-        self.api_client = StockaDoodleAPI()
+        # called directly with the verified user; mfa_verified is emitted only without it
+        self._on_verified = on_verified
+        # reuse the shared client so verification rides its warm connection pool
+        self.api_client = api_client or get_api()
         self._verifying = False
+        # codes the server already rejected; re-entering one is refused locally
+        self._rejected_codes = set()
+        self._pending_code = None
 
         self.setWindowTitle("Two-Factor Authentication")
         self.setFixedSize(380, 300)
         self.setStyleSheet(get_dialog_style())
         self.setModal(True)
 
-        icon_path = os.path.join(
-            os.path.dirname(__file__), "..", "assets", "icons", "stockadoodle-transparent.png"
-        )
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if _ICON_PATH is not None:
+            self.setWindowIcon(_window_icon())
 
-        self.init_ui()
+        # let typing/pasting settle before auto-submitting a full code
+        self._submit_timer = QTimer(self)
+        self._submit_timer.setSingleShot(True)
+        self._submit_timer.setInterval(self.AUTO_SUBMIT_DELAY_MS)
+        self._submit_timer.timeout.connect(self._auto_submit)
+
+        # widgets are built on first show; constructing the dialog stays cheap
+        self._ui_built = False
+        self._verify_finished.connect(self._on_verify_finished)
+
+    def showEvent(self, event):
+        if not self._ui_built:
+            self.init_ui()
+            self._ui_built = True
+        super().showEvent(event)
+
+    @classmethod
+    def _ensure_icons(cls):
+        if cls._CANCEL_ICON is None:
+            cls._CANCEL_ICON = get_feather_icon("x")
+            cls._VERIFY_ICON = get_feather_icon("check-circle")
 
     def init_ui(self):
+        self._ensure_icons()
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(30, 30, 30, 30)
         layout.setSpacing(20)
 
-        title = QLabel("Two-Factor Authentication")
-        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        # PyQt applies Qt properties passed as keywords during construction
+        title = QLabel("Two-Factor Authentication", alignment=_CENTER, font=self._TITLE_FONT)
         layout.addWidget(title)
 
         desc = QLabel(
             "A verification code has been sent to your email.\n"
-            "Please enter the 6-digit code below."
+            "Please enter the 6-digit code below.",
+            alignment=_CENTER,
+            wordWrap=True
         )
-        desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        desc.setWordWrap(True)
         layout.addWidget(desc)
 
-        self.code_input = QLineEdit()
-        self.code_input.setPlaceholderText("Enter 6-digit code")
-        self.code_input.setMaxLength(6)
-        self.code_input.setFont(QFont("Consolas", 18))
-        self.code_input.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.code_input = QLineEdit(
+            placeholderText="Enter 6-digit code",
+            maxLength=6,
+            font=self._CODE_FONT,
+            alignment=_CENTER
+        )
         self.code_input.setFixedHeight(60)
-        self.code_input.textChanged.connect(self.format_code_input)
-        self.code_input.textChanged.connect(self.check_auto_submit)
+        # non-digits are rejected before textChanged ever fires
+        self.code_input.setValidator(
+            QRegularExpressionValidator(QRegularExpression(r"\d{0,6}"), self.code_input)
+        )
+        self.code_input.textChanged.connect(self._on_code_changed)
         layout.addWidget(self.code_input)
 
         btn_layout = QHBoxLayout()
 
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setIcon(get_feather_icon("x"))
-        cancel_btn.clicked.connect(self.reject)
+        cancel_btn = QPushButton("Cancel", icon=self._CANCEL_ICON, clicked=self.reject)
 
-        verify_btn = QPushButton("Verify")
-        verify_btn.setIcon(get_feather_icon("check-circle"))
-        verify_btn.clicked.connect(self.verify_code)
+        self.verify_btn = QPushButton(
+            "Verify", icon=self._VERIFY_ICON, clicked=self.verify_code
+        )
 
         btn_layout.addWidget(cancel_btn)
-        btn_layout.addWidget(verify_btn)
+        btn_layout.addWidget(self.verify_btn)
         layout.addLayout(btn_layout)
 
-    def format_code_input(self, text):
-        if not text.isdigit():
-            self.code_input.setText("".join(filter(str.isdigit, text)))
+    def _on_code_changed(self, text):
+        # the only textChanged slot; a complete code (re)arms the auto-submit,
+        # and the timer restart collapses a burst of edits into one check
+        if len(text) == 6:
+            self._submit_timer.start()
+        else:
+            self._submit_timer.stop()
 
-    def check_auto_submit(self):
+    def _auto_submit(self):
         if len(self.code_input.text()) == 6 and not self._verifying:
             self.verify_code()
 
     def verify_code(self):
+        # Enter/Verify beat the debounce: drop the pending auto-submit
+        self._submit_timer.stop()
         if self._verifying:
             return
 
-        code = self.code_input.text().strip()
+        # the validator already limits input to digits, so only the length is left to check
+        code = self.code_input.text()
+
+        if len(code) != 6:
+            self._show_message(QMessageBox.Icon.Warning, "Invalid Code", "Please enter a valid 6-digit code.")
+            return
+
+        if code in self._rejected_codes:
+            self._show_message(QMessageBox.Icon.Critical, "Verification Failed", "Invalid verification code.")
+            self.code_input.clear()
+            return
+
+        self._pending_code = code
+        self._set_busy(True)
+
+        # keep the network round-trip off the GUI thread
+        future = self.api_client.submit(
+            self.api_client.verify_mfa_code, self.user_data["username"], code
+        )
+        future.add_done_callback(self._deliver_verify_result)
+
+    def _deliver_verify_result(self, future):
+        # runs on a worker thread; the queued signal hops back to the GUI thread
+        error = future.exception()
+        self._verify_finished.emit(None if error else future.result(), error)
+
+    def _on_verify_finished(self, result, error):
+        self._set_busy(False)
 
-        if len(code) != 6 or not code.isdigit():
-            QMessageBox.warning(self, "Invalid Code", "Please enter a valid 6-digit code.")
+        # dialog was cancelled while the request was in flight
+        if not self.isVisible():
             return
 
-        self._verifying = True
+        if isinstance(error, StockaDoodleAPIError) and error.status_code == 401:
+            self._rejected_codes.add(self._pending_code)
 
-        try:
-            result = self.api_client.verify_mfa_code(self.user_data["username"], code)
-            user = result.get("user")
+        if error is not None:
+            self._show_message(QMessageBox.Icon.Critical, "Verification Failed", f"Code verification failed:\n{error}")
+            self.code_input.clear()
+            self.code_input.setFocus()
+            return
 
-            if user:
-                QMessageBox.information(self, "Success", "Authentication successful!")
-                self.mfa_verified.emit(user)
-                self.accept()
-            else:
-                QMessageBox.critical(self, "Verification Failed", "Invalid verification code.")
-                self.code_input.clear()
-                self.code_input.setFocus()
+        user = result.get("user")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Verification Failed", f"Code verification failed:\n{e}")
+        if user:
+            # no modal "success" box: like a plain login, the main window opening is the confirmation
+            if self._on_verified is not None:
+                self._on_verified(user)
+            else:
+                self.mfa_verified.emit(user)
+            self.accept()
+        else:
+            self._rejected_codes.add(self._pending_code)
+            self._show_message(QMessageBox.Icon.Critical, "Verification Failed", "Invalid verification code.")
             self.code_input.clear()
             self.code_input.setFocus()
-        finally:
-            self._verifying = False
+
+    def _show_message(self, icon, title: str, text: str):
+        # open() is window-modal but returns immediately, unlike exec()/critical()
+        box = QMessageBox(icon, title, text, QMessageBox.StandardButton.Ok, self)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
+
+    def _set_busy(self, busy: bool):
+        self._verifying = busy
+        self.code_input.setEnabled(not busy)
+        self.verify_btn.setEnabled(not busy)
+        self.verify_btn.setText("Verifying..." if busy else "Verify")
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import traceback
 from dataclasses import dataclass
+from functools import partial
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional
 
@@ -990,20 +991,31 @@ class DashboardPage(QWidget):
         self.card_3.title_lbl.setText("Total Products")
         self.card_4.title_lbl.setText("Total Users")
 
-        products_data = self.api.get_products(per_page=9999)
+        end_d = date.today()
+        start_d = end_d - timedelta(days=3650)
+
+        # the three lookups are independent, so fetch them concurrently
+        products_data, users_data, sales_data = self.api.fetch_many(
+            partial(self.api.get_products, per_page=9999),
+            self.api.get_users,
+            partial(self.api.get_sales, start_date=start_d.isoformat(), end_date=end_d.isoformat()),
+        )
+
+        if isinstance(products_data, Exception):
+            raise products_data
         prods = products_data.get("products", []) or []
         self.card_3.set_value(str(len(prods)))
 
-        users_data = self.api.get_users()
+        if isinstance(users_data, Exception):
+            raise users_data
         users_list = users_data if isinstance(users_data, list) else (users_data.get("users", []) or [])
         self.card_4.set_value(str(len(users_list)))
 
         total_sales_count = 0
         total_revenue = 0.0
         try:
-            end_d = date.today()
-            start_d = end_d - timedelta(days=3650)
-            sales_data = self.api.get_sales(start_date=start_d.isoformat(), end_date=end_d.isoformat())
+            if isinstance(sales_data, Exception):
+                raise sales_data
             sales_list = sales_data.get("sales", []) or []
             total_sales_count = len(sales_list)
             for s in sales_list:
@@ -1026,7 +1038,18 @@ class DashboardPage(QWidget):
         self.card_3.title_lbl.setText("Revenue (30d)")
         self.card_4.title_lbl.setText("Qty Sold (30d)")
 
-        products_data = self.api.get_products(per_page=9999)
+        end_d = date.today()
+        start_d = end_d - timedelta(days=29)
+
+        # the three lookups are independent, so fetch them concurrently
+        products_data, ar, sales_data = self.api.fetch_many(
+            partial(self.api.get_products, per_page=9999),
+            partial(self.api.get_alerts_report, days_ahead=7),
+            partial(self.api.get_sales, start_date=start_d.isoformat(), end_date=end_d.isoformat()),
+        )
+
+        if isinstance(products_data, Exception):
+            raise products_data
         prods = products_data.get("products", []) or []
         low_stock = [
             p for p in prods
@@ -1036,7 +1059,8 @@ class DashboardPage(QWidget):
 
         expiring_count = 0
         try:
-            ar = self.api.get_alerts_report(days_ahead=7)
+            if isinstance(ar, Exception):
+                raise ar
             summary = ar.get("summary", {}) or {}
             expiring_count = int(summary.get("total_alerts", 0) or 0)
         except Exception:
@@ -1046,9 +1070,8 @@ class DashboardPage(QWidget):
         qty_sold_30d = 0.0
         rev_30d = 0.0
         try:
-            end_d = date.today()
-            start_d = end_d - timedelta(days=29)
-            sales_data = self.api.get_sales(start_date=start_d.isoformat(), end_date=end_d.isoformat())
+            if isinstance(sales_data, Exception):
+                raise sales_data
             sales_list = sales_data.get("sales", []) or []
             for s in sales_list:
                 rev_30d += _safe_float(s.get("total_amount"))
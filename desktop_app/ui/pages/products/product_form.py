@@ -12,7 +12,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QDate, pyqtSignal
 
-from desktop_app.api_client.stockadoodle_api import StockaDoodleAPI, StockaDoodleAPIError
+from desktop_app.api_client.stockadoodle_api import StockaDoodleAPIError
+from desktop_app.utils.api_wrapper import get_api
 
 
 class ProductFormPage(QWidget):
@@ -35,7 +36,7 @@ class ProductFormPage(QWidget):
     ):
         super().__init__(parent)
         self.user = user_data or {}
-        self.api = StockaDoodleAPI()
+        self.api = get_api()
 
         # If product is passed, treat as edit mode
         self.product = product
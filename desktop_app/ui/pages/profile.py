@@ -380,9 +380,8 @@ class ProfilePage(QWidget):
         uid = self.user.get("id")
         local_path = _local_profile_photo_path(uid)
 
-        pix = QPixmap()
-        if os.path.exists(local_path):
-            pix = QPixmap(local_path)
+        # a missing file just gives a null pixmap
+        pix = QPixmap(local_path)
 
         if not pix.isNull():
             pix = _round_pixmap(pix, AVATAR_SIZE)
@@ -438,13 +437,9 @@ class ProfilePage(QWidget):
             self.user_updated.emit({"profile_image_path": save_path})
 
             # Optional best-effort backend update (won't break if not supported)
+            # the client opens and encodes the file itself
             try:
-                with open(save_path, "rb") as f:
-                    raw = f.read()
-                try:
-                    self.api.update_user(int(uid), image_data=raw)  # type: ignore
-                except Exception:
-                    pass
+                self.api.update_user(int(uid), image_data=Path(save_path))  # type: ignore
             except Exception:
                 pass
 
@@ -463,8 +458,10 @@ class ProfilePage(QWidget):
 
         try:
             save_path = _local_profile_photo_path(uid)
-            if os.path.exists(save_path):
+            try:
                 os.remove(save_path)
+            except FileNotFoundError:
+                pass
 
             # update local user dict + sidebar
             if "profile_image_path" in self.user:
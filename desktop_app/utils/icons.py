@@ -1,6 +1,7 @@
 # desktop_app/utils/icons.py
 
 import os
+from functools import lru_cache
 from typing import Optional
 
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
@@ -49,6 +50,7 @@ def _tint_pixmap(pix: QPixmap, color: str) -> QPixmap:
     return tinted
 
 
+@lru_cache(maxsize=None)
 def get_icon(icon_name: str, size: int = 24, color: Optional[str] = None) -> QIcon:
     """
     Generic icon loader.
@@ -56,6 +58,8 @@ def get_icon(icon_name: str, size: int = 24, color: Optional[str] = None) -> QIc
     - Tries PNG first (optionally tinted)
     - Then tries SVG (optionally stroke/fill tinted)
     - Silent fallback on failure
+    - Cached per (name, size, color): QIcon is implicitly shared, so
+      repeat lookups skip the disk read and render entirely
     """
     png, svg = _icon_path(icon_name)
 